@@ -167,6 +167,9 @@ def get_llm_provider(workflow: str = None, **kwargs) -> 'LitellmProvider':
     Outputs: LitellmProvider instance configured for the specified workflow
     Role: Centralizes all logic for LLM selection and secrets management based on workflow.
     """
+    # API keys usually come from .env
+    from ports.profile_loader import ensure_env_loaded
+    ensure_env_loaded()
     config = _load_config()
     
     # Get workflow-specific config or fall back to defaults
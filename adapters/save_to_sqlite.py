@@ -17,6 +17,50 @@ import shutil
 from datetime import datetime
 
 
+def ensure_filename_fts(cursor: sqlite3.Cursor, table_name: str = "catalog", verbose: bool = False) -> bool:
+    """
+    Purpose: Create (once) an FTS5 trigram index over filename, kept in sync with the catalog table by triggers
+    Inputs:
+        cursor (sqlite3.Cursor): Cursor on library.sqlite
+        table_name (str): Name of the catalog table
+        verbose (bool): Enable verbose logging
+    Outputs: True if {table_name}_fts is available, False if this SQLite build lacks FTS5/trigram
+    Role: Lets sqlite_search answer filename LIKE '%term%' from an index instead of scanning the catalog.
+          The index is external-content (filenames are not stored twice) and rebuilt only when first created.
+    """
+    fts_name = f"{table_name}_fts"
+    wanted = [fts_name, f"{fts_name}_ai", f"{fts_name}_ad", f"{fts_name}_au"]
+    cursor.execute(f"SELECT name FROM sqlite_master WHERE name IN ({', '.join('?' for _ in wanted)})", wanted)
+    existing = {row[0] for row in cursor.fetchall()}
+    if existing == set(wanted):
+        return True
+    try:
+        log_event(f"[STEP] Building filename search index '{fts_name}'", verbose)
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5("
+            f"filename, content='{table_name}', content_rowid='rowid', tokenize='trigram')"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {table_name} BEGIN "
+            f"INSERT INTO {fts_name}(rowid, filename) VALUES (new.rowid, new.filename); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {table_name} BEGIN "
+            f"INSERT INTO {fts_name}({fts_name}, rowid, filename) VALUES ('delete', old.rowid, old.filename); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE OF filename ON {table_name} BEGIN "
+            f"INSERT INTO {fts_name}({fts_name}, rowid, filename) VALUES ('delete', old.rowid, old.filename); "
+            f"INSERT INTO {fts_name}(rowid, filename) VALUES (new.rowid, new.filename); END"
+        )
+        # Index whatever the catalog already holds (rows written before the triggers existed)
+        cursor.execute(f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')")
+        return True
+    except sqlite3.OperationalError as e:
+        log_event(f"[INFO] Filename search index unavailable, searches will scan the catalog: {e}", verbose)
+        return False
+
+
 def save_dataframe_to_sqlite(
     df: pd.DataFrame, 
     root: Path, 
@@ -25,7 +69,7 @@ def save_dataframe_to_sqlite(
     verbose: bool = False,
     backup_db: bool = False,
     force_new: bool = False
-):
+) -> bool:
     """
     Purpose: Save pandas DataFrame to SQLite database with incremental updates
     Inputs:
@@ -36,7 +80,7 @@ def save_dataframe_to_sqlite(
         verbose (bool): Enable verbose logging
         backup_db (bool): Create a backup of the database if True
         force_new (bool): Force creation of a new database, dropping existing data
-    Outputs: None
+    Outputs: bool - True if the catalog was committed, False if the save failed (the error is logged)
     Role: Persists catalog data in SQLite format for querying and analysis with efficient incremental updates
     """
     catalog_dir = catalog_folder
@@ -76,6 +120,8 @@ def save_dataframe_to_sqlite(
         if force_new:
             log_event(f"[STEP] Dropping existing table and creating new one", verbose)
             cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+            # The search index would otherwise keep pointing at the dropped rows
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}_fts")
             conn.commit()
             
         # Check if table exists
@@ -116,47 +162,39 @@ def save_dataframe_to_sqlite(
             keys_to_delete = db_keys - file_keys
             if keys_to_delete:
                 log_event(f"[STEP] Deleting {len(keys_to_delete)} records for files that no longer exist", verbose)
-                for key in keys_to_delete:
-                    cursor.execute(
-                        f"DELETE FROM {table_name} WHERE relative_path = ? AND filename = ? AND extension = ?",
-                        key
-                    )
+                cursor.executemany(
+                    f"DELETE FROM {table_name} WHERE relative_path = ? AND filename = ? AND extension = ?",
+                    keys_to_delete
+                )
             
             # Convert textracted to int for SQLite
             df['textracted'] = df['textracted'].astype(int)
+            # Nullable pandas dtypes use pd.NA, which sqlite3 cannot bind; pass None instead
+            df = df.astype(object).where(df.notna(), None)
             
-            # Update or insert records
+            # Update or insert records; db_keys already says which rows exist, so no per-row lookup is needed.
+            # All statements run in the one implicit transaction committed below.
             log_event(f"[STEP] Updating or inserting {len(df)} records", verbose)
-            for _, row in df.iterrows():
-                # Check if this record exists
-                cursor.execute(
-                    f"SELECT last_modified FROM {table_name} WHERE relative_path = ? AND filename = ? AND extension = ?",
-                    (row['relative_path'], row['filename'], row['extension'])
+            key_cols = ['relative_path', 'filename', 'extension']
+            value_cols = ['last_modified', 'file_size_in_MB', 'textracted', 'token_count', 'sha256']
+            exists = [key in db_keys for key in zip(df['relative_path'], df['filename'], df['extension'])]
+            existing_rows = df[exists]
+            # A key seen twice in one scan ends with its last values, as sequential insert-then-update did
+            new_rows = df[[not e for e in exists]].drop_duplicates(subset=key_cols, keep='last')
+            if len(existing_rows):
+                # Update existing records
+                cursor.executemany(
+                    f"UPDATE {table_name} SET last_modified = ?, file_size_in_MB = ?, textracted = ?, token_count = ?, sha256 = ? "
+                    f"WHERE relative_path = ? AND filename = ? AND extension = ?",
+                    existing_rows[value_cols + key_cols].itertuples(index=False, name=None)
+                )
+            if len(new_rows):
+                # Insert new records
+                cursor.executemany(
+                    f"INSERT INTO {table_name} (relative_path, filename, extension, last_modified, file_size_in_MB, textracted, token_count, sha256) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    new_rows[key_cols + value_cols].itertuples(index=False, name=None)
                 )
-                result = cursor.fetchone()
-                
-                if result:
-                    # Update existing record
-                    cursor.execute(
-                        f"UPDATE {table_name} SET last_modified = ?, file_size_in_MB = ?, textracted = ?, token_count = ?, sha256 = ? "
-                        f"WHERE relative_path = ? AND filename = ? AND extension = ?",
-                        (
-                            row['last_modified'], row['file_size_in_MB'], int(row['textracted']), 
-                            row['token_count'], row['sha256'], row['relative_path'], 
-                            row['filename'], row['extension']
-                        )
-                    )
-                else:
-                    # Insert new record
-                    cursor.execute(
-                        f"INSERT INTO {table_name} (relative_path, filename, extension, last_modified, file_size_in_MB, textracted, token_count, sha256) "
-                        f"VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                        (
-                            row['relative_path'], row['filename'], row['extension'], 
-                            row['last_modified'], row['file_size_in_MB'], int(row['textracted']), 
-                            row['token_count'], row['sha256']
-                        )
-                    )
         
         # Create indexes for faster querying
         log_event(f"[STEP] Creating indexes for faster querying", verbose)
@@ -164,6 +202,7 @@ def save_dataframe_to_sqlite(
         cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_textracted ON {table_name} (textracted)")
         cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_filename ON {table_name} (filename)")
         cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_sha256 ON {table_name} (sha256)")
+        ensure_filename_fts(cursor, table_name, verbose)
         
         # Commit changes and close connection
         conn.commit()
@@ -172,8 +211,10 @@ def save_dataframe_to_sqlite(
         # Calculate and log execution time
         execution_time = time.time() - start_time
         log_event(f"[END] SQLite database updated at {db_path} ({execution_time:.2f} seconds)", verbose)
+        return True
     except Exception as e:
         log_event(f"[ERROR] Failed to save to SQLite database: {e}", verbose)
         # Print full exception for debugging
         import traceback
         log_event(traceback.format_exc(), verbose)
+        return False
@@ -230,9 +230,7 @@ def interactive_search(args):
           encapsulating all search logic within the adapter layer.
     """
     # Local (lazy) imports to avoid unnecessary dependencies at module import time
-    import subprocess
     import sys
-    from pathlib import Path
     from ports.profile_loader import load_profile_config
 
     # Check if user query was provided externally (e.g., from book_recommender)
@@ -248,23 +246,12 @@ def interactive_search(args):
     if getattr(args, "verbose", False):
         log_event(f"[DEBUG] User query: {user_query}", True)
 
-    # Derive keyword search terms using the LLM-powered query processor
-    project_root = Path(__file__).parent.parent
-    query_proc_path = project_root / "agents" / "query_processor.py"
-    if not query_proc_path.exists():
-        print(f"[ERROR] Query processor not found at {query_proc_path}")
-        sys.exit(1)
-
+    # Derive keyword search terms using the LLM-powered query processor, in this process
     try:
-        result = subprocess.run(
-            [sys.executable, str(query_proc_path), user_query],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        search_terms = result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"[ERROR] Query processor failed: {e.stderr}")
+        from agents.query_processor import extract_keywords
+        search_terms = extract_keywords(user_query, verbose=getattr(args, "verbose", False))
+    except Exception as e:
+        print(f"[ERROR] Query processor failed: {e}")
         sys.exit(1)
 
     if getattr(args, "verbose", False):
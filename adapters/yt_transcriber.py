@@ -12,7 +12,8 @@ from pathlib import Path
 from typing import Optional, List
 import yt_dlp
 import glob
-from ports.transcript_archive import process_transcript_archive, extract_video_id
+from ports.transcript_archive import process_transcript_archive, process_transcript_archive_batch, extract_video_id
+from core.log_utils import log_event
 
 def download_transcript(
     video_url: str, 
@@ -33,8 +34,6 @@ def download_transcript(
         bool: True if successful, False otherwise
     Role: Core function for YouTube transcript downloading.
     """
-    from core.log_utils import log_event
-    
     try:
         # Create full output path with optional subfolder
         full_output_path = output_folder
@@ -111,17 +110,17 @@ def download_transcript(
                         log_event(f"All files after yt-dlp run: {[str(f) for f in all_files]}", verbose)
                         transcript_files = list(Path(output_folder).glob('*.vtt'))
                         log_event(f"VTT files after yt-dlp run: {[str(f) for f in transcript_files]}", verbose)
-                    # Handle playlists
+                    # Handle playlists; archive all entries with one write to the archive CSV
                     if info and 'entries' in info:
+                        archive_entries = []
                         for entry in info['entries']:
                             if entry:
                                 entry_id = entry.get('id')
                                 entry_url = f"https://www.youtube.com/watch?v={entry_id}"
                                 entry_title = entry.get('title', 'Unknown Title')
                                 entry_date = entry.get('upload_date', 'Unknown Date')
-                                expected_filename = f"{entry_date} {entry_title}.txt"
-                                if process_transcript_archive(entry_url, expected_filename, catalog_folder, verbose):
-                                    pass  # Place any per-video logic here if needed
+                                archive_entries.append((entry_url, f"{entry_date} {entry_title}.txt"))
+                        process_transcript_archive_batch(archive_entries, catalog_folder, verbose)
                     return True
             except Exception as e:
                 if verbose:
@@ -140,7 +139,6 @@ def download_transcript(
                 info = ydl.extract_info(video_url, download=True)
                 # Verbose: log info dict and all files in output folder
                 if verbose:
-                    from core.log_utils import log_event
                     log_event(f"yt-dlp info.keys(): {list(info.keys())}", verbose)
                     subs = info.get('subtitles', {})
                     autosubs = info.get('automatic_captions', {})
@@ -150,17 +148,17 @@ def download_transcript(
                     log_event(f"All files after yt-dlp run: {[str(f) for f in all_files]}", verbose)
                     transcript_files = list(Path(output_folder).glob('*.vtt'))
                     log_event(f"VTT files after yt-dlp run: {[str(f) for f in transcript_files]}", verbose)
-                # Handle playlists
+                # Handle playlists; archive all entries with one write to the archive CSV
                 if info and 'entries' in info:
+                    archive_entries = []
                     for entry in info['entries']:
                         if entry:
                             entry_id = entry.get('id')
                             entry_url = f"https://www.youtube.com/watch?v={entry_id}"
                             entry_title = entry.get('title', 'Unknown Title')
                             entry_date = entry.get('upload_date', 'Unknown Date')
-                            expected_filename = f"{entry_date} {entry_title}.txt"
-                            if process_transcript_archive(entry_url, expected_filename, catalog_folder, verbose):
-                                pass  # Place any per-video logic here if needed
+                            archive_entries.append((entry_url, f"{entry_date} {entry_title}.txt"))
+                    process_transcript_archive_batch(archive_entries, catalog_folder, verbose)
                 return True
         except Exception as e:
             if verbose:
@@ -236,7 +234,6 @@ def convert_vtt_files(folder_path: Path, verbose: bool = False) -> List[str]:
         List[str]: List of created TXT file paths
     Role: Helper function to process VTT files after download
     """
-    from core.log_utils import log_event
     from ports.convertVTTtoTXT import extract_vtt_to_txt
     
     converted_files = []
@@ -283,8 +280,6 @@ def process_transcript_request(config: dict, verbose: bool = False) -> None:
     Outputs: None
     Role: Main entry point for transcript downloading workflow.
     """
-    from core.log_utils import log_event
-    
     # Get transcript folder from config
     if "yt_transcripts_folder" not in config:
         raise KeyError("yt_transcripts_folder not found in configuration")
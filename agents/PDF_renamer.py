@@ -9,6 +9,8 @@ Abstract Spec: Provider abstraction and prompt decoupling enable flexible, testa
 
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +19,9 @@ from PyPDF2 import PdfReader, PdfWriter
 from adapters.llm_provider import get_llm_provider
 from core.log_utils import log_event
 
+# PDFs identified at once; each job mostly waits on the LLM round-trip, so threads overlap that latency
+IDENTIFY_MAX_CONCURRENCY = 4
+
 # --- Prompt Loader ---
 
 def load_prompt(prompt_path: Path) -> str:
@@ -50,13 +55,13 @@ def sanitize_filename(raw: str, limit: int = 200) -> str:
 
 # --- Destination Path Helper ---
 
-def make_destination_path(base_dir: Path, proposed: str) -> Path:
-    """Return a unique destination Path for the proposed filename within *base_dir*."""
+def make_destination_path(base_dir: Path, proposed: str, reserved: Optional[set] = None) -> Path:
+    """Return a unique destination Path for the proposed filename within *base_dir*, avoiding paths in *reserved*."""
     if not proposed.lower().endswith(".pdf"):
         proposed += ".pdf"
     candidate = base_dir / proposed
     counter = 1
-    while candidate.exists():
+    while candidate.exists() or (reserved is not None and candidate in reserved):
         stem, ext = os.path.splitext(proposed)
         candidate = base_dir / f"{stem}_{counter}{ext}"
         counter += 1
@@ -89,8 +94,9 @@ def update_and_save_pdf_metadata(src_pdf: Path, dest_pdf: Path, author: str, tit
 
 # --- Single PDF Processing ---
 
-def process_single_pdf(pdf_path: Path, llm, prompt: str, n_pages: int = 5, verbose: bool = False):
-    """Process a single PDF – rename and embed metadata."""
+def process_single_pdf(pdf_path: Path, llm, prompt: str, n_pages: int = 5, verbose: bool = False,
+                       reserved: Optional[set] = None, reserve_lock: Optional[threading.Lock] = None):
+    """Process a single PDF – rename and embed metadata. *reserved*/*reserve_lock* keep concurrent jobs from picking the same name."""
     log_event(f"[INFO] Processing {pdf_path.name}", verbose)
     extracted = extract_first_n_pages_text(pdf_path, n_pages, verbose)
     if not extracted:
@@ -104,7 +110,12 @@ def process_single_pdf(pdf_path: Path, llm, prompt: str, n_pages: int = 5, verbo
 
     candidate = f"{guessed['author']} - {guessed['title']} ({guessed['pubdate']})"
     clean_candidate = sanitize_filename(candidate)
-    dest_path = make_destination_path(pdf_path.parent, clean_candidate)
+    if reserve_lock is None:
+        dest_path = make_destination_path(pdf_path.parent, clean_candidate, reserved)
+    else:
+        with reserve_lock:
+            dest_path = make_destination_path(pdf_path.parent, clean_candidate, reserved)
+            reserved.add(dest_path)
 
     if update_and_save_pdf_metadata(
         pdf_path,
@@ -123,8 +134,9 @@ def process_single_pdf(pdf_path: Path, llm, prompt: str, n_pages: int = 5, verbo
 
 # --- Directory Batch Processing ---
 
-def process_pdf_directory(directory: Path, llm=None, prompt: str | None = None, n_pages: int = 5, verbose: bool = False):
-    """Batch-process all PDFs in *directory*."""
+def process_pdf_directory(directory: Path, llm=None, prompt: str | None = None, n_pages: int = 5, verbose: bool = False,
+                          max_concurrency: int = IDENTIFY_MAX_CONCURRENCY):
+    """Batch-process all PDFs in *directory*, up to *max_concurrency* at a time (1 processes them in order)."""
     log_event(f"[INFO] Starting PDF batch in {directory}", verbose)
     if llm is None:
         llm = get_llm_provider(workflow="identify")
@@ -136,6 +148,14 @@ def process_pdf_directory(directory: Path, llm=None, prompt: str | None = None,
         key=lambda p: p.stat().st_mtime,
         reverse=True,
     )
-    for pdf in pdfs:
-        process_single_pdf(pdf, llm, prompt, n_pages, verbose)
+    if max_concurrency <= 1 or len(pdfs) <= 1:
+        for pdf in pdfs:
+            process_single_pdf(pdf, llm, prompt, n_pages, verbose)
+    else:
+        reserved = set()
+        reserve_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            list(executor.map(
+                lambda pdf: process_single_pdf(pdf, llm, prompt, n_pages, verbose, reserved, reserve_lock), pdfs
+            ))
     log_event("[DONE] PDF processing completed.", verbose)
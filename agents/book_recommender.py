@@ -22,9 +22,9 @@ except ImportError:
     print("[Warning] python-dotenv not installed. If you use a .env file for secrets, install with: pip install python-dotenv")
 
 # Ensure project root is in sys.path for absolute imports
-project_root = Path(__file__).resolve().parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 try:
     from adapters.llm_provider import get_llm_provider
@@ -8,6 +8,7 @@ Abstract Spec: See dev/project-brief.md Sprint 35
 """
 
 import sys
+import os
 from pathlib import Path
 
 # Load .env file from project root for environment variables
@@ -18,14 +19,18 @@ except ImportError:
     print("[Warning] python-dotenv not installed. If you use a .env file for secrets, install with: pip install python-dotenv")
 
 # Ensure project root is in sys.path for absolute imports
-project_root = Path(__file__).resolve().parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 try:
     from adapters.llm_provider import get_llm_provider
     from core.file_utils import load_prompt, load_config
+    from core.log_utils import log_event
 except ModuleNotFoundError as e:
+    if __name__ != "__main__":
+        # Imported in-process (e.g. by adapters/search_and_retrieve.py): let the caller report it
+        raise ImportError(f"Could not import query processor dependencies: {e}") from e
     print("\n[ImportError] Could not import required modules.\n"
           "Make sure you are running this script from the project root, "
           "or that the library-manager-lite directory is in your PYTHONPATH.\n"
@@ -34,6 +39,38 @@ except ModuleNotFoundError as e:
 
 # prompt_user removed: user query is now passed as a CLI argument
 
+def extract_keywords(user_query: str, verbose: bool = False) -> str:
+    """
+    Purpose: Turn a natural-language research query into semicolon-separated search keywords using the LLM.
+    Inputs: user_query (str), verbose (bool)
+    Outputs: Semicolon-separated keywords (str, stripped)
+    Role: In-process entry used by adapters/search_and_retrieve.py. Raises FileNotFoundError if the system
+          prompt is missing; LLM provider errors propagate to the caller.
+    """
+    # Load system prompt
+    prompt_path = Path(__file__).parent / "query_processor_prompt.txt"
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"System prompt file not found: {prompt_path}")
+    system_prompt = load_prompt(str(prompt_path))
+
+    # Get LLM provider for this workflow
+    try:
+        provider = get_llm_provider(workflow="search_query")
+        workflow = "search_query"
+    except Exception as e:
+        log_event(f"[INFO] No search_query LLM provider ({e}); using the default provider", verbose)
+        provider = get_llm_provider()
+        workflow = "default"
+    if verbose:
+        log_event(f"[INFO] Query processor using {workflow} provider: {getattr(provider, 'model', provider)}", True)
+
+    # Call LLM to extract keywords
+    response = provider.completion(system_prompt, user_query.strip(), output_format="text")
+    keywords = response.strip()
+    if verbose:
+        log_event(f"[INFO] Extracted keywords for query '{user_query.strip()}': {keywords}", True)
+    return keywords
+
 def main():
     """
     Purpose: Entry point for query processor. Loads config, system prompt, receives user query as CLI arg, calls LLM, prints keywords.
@@ -46,34 +83,22 @@ def main():
     parser.add_argument("user_query", type=str, help="User's natural language search query")
     args = parser.parse_args()
     user_query = args.user_query.strip()
-    current_research_query = user_query
 
     # Load config/profile
     config_path = Path(__file__).resolve().parent.parent / "user_inputs" / "folder_paths.json"
     config = load_config(str(config_path))
 
-    # Load system prompt
-    prompt_path = Path(__file__).parent / "query_processor_prompt.txt"
-    if not prompt_path.exists():
-        print(f"System prompt file not found: {prompt_path}")
-        sys.exit(1)
-    system_prompt = load_prompt(str(prompt_path))
-
-    # Get LLM provider for this workflow
     try:
-        provider = get_llm_provider(workflow="search_query")
-    except Exception:
-        provider = get_llm_provider()
-
-    # Call LLM to extract keywords
-    try:
-        response = provider.completion(system_prompt, user_query, output_format="text")
+        keywords = extract_keywords(user_query)
+    except FileNotFoundError as e:
+        print(str(e))
+        sys.exit(1)
     except Exception as e:
         print(f"[ERROR] LLM call failed: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Output semicolon-separated keywords
-    print(response.strip())
+    print(keywords)
 
 if __name__ == "__main__":
     main()
@@ -10,16 +10,12 @@ Provides robust help system that can handle future flags.
 
 from pathlib import Path
 import sys
-from dotenv import load_dotenv
 import argparse
-import json
+# ports.profile_loader loads .env on first use
 from ports.profile_loader import load_profile_config, add_profile_arg
 
-from core.catalog_files import run_catalog_workflow
-from core.catalog_analyzer import analyze_catalog
-from core.file_utils import load_config, load_prompt
-
-load_dotenv()
+# Workflow modules (pandas, PyMuPDF) are imported inside the handlers that use them,
+# so --help and unknown-flag runs stay fast.
 
 def display_help(parser):
     """
@@ -28,39 +24,41 @@ def display_help(parser):
     Outputs: None (prints to console)
     Role: Provides user-friendly help information about all available flags.
     """
-    # Get all actions from parser
-    actions = parser._actions
-    
-    print("\nLibrary Manager Lite - PDF Text Extraction and Cataloging System\n")
-    print("USAGE:")
-    print("  python catalog.py [FLAGS]\n")
-    print("FLAGS:")
-    
     # Filter out the default help action
-    flag_actions = [action for action in actions if action.option_strings]
+    flag_actions = [action for action in parser._actions if action.option_strings]
     
     # Calculate the maximum length for padding
     max_flag_length = max(len(action.option_strings[0]) for action in flag_actions) + 2
     
-    # Print each flag with its help text, properly aligned
-    for action in flag_actions:
-        flag = action.option_strings[0]
-        help_text = action.help
-        print(f"  {flag:<{max_flag_length}} {help_text}")
-    
-    print("\nEXAMPLES:")
-    print("  python catalog.py                      # Run incremental catalog update with analysis")
-    print("  python catalog.py --recatalog          # Force regenerate catalog from scratch with analysis")
-    print("  python catalog.py --no-analysis        # Run incremental update without analysis")
-    print("  python catalog.py --analysis           # Only analyze existing catalog (no updates)")
-    print("  python catalog.py --convert            # Extract text from PDFs and convert MD to TXT")
-    print("  python catalog.py --verbose --tokenize # Run with verbose logging and token counting")
-    print("  python catalog.py --convert --tokenize # Extract text and count tokens")
-    print("  python identify.py                    # Rename PDFs in buffer folder using LLM")
-    print("  python transcribe.py                  # Download transcripts from YouTube videos")
-    print("  python catalog.py --search             # Search for files by filename in the SQLite database")
-    print("  python catalog.py --help               # Display this help message and exit")
-    print()
+    lines = [
+        "",
+        "Library Manager Lite - PDF Text Extraction and Cataloging System",
+        "",
+        "USAGE:",
+        "  python catalog.py [FLAGS]",
+        "",
+        "FLAGS:",
+    ]
+    # Each flag with its help text, properly aligned
+    lines.extend(f"  {action.option_strings[0]:<{max_flag_length}} {action.help}" for action in flag_actions)
+    lines.extend([
+        "",
+        "EXAMPLES:",
+        "  python catalog.py                      # Run incremental catalog update with analysis",
+        "  python catalog.py --recatalog          # Force regenerate catalog from scratch with analysis",
+        "  python catalog.py --no-analysis        # Run incremental update without analysis",
+        "  python catalog.py --analysis           # Only analyze existing catalog (no updates)",
+        "  python catalog.py --convert            # Extract text from PDFs and convert MD to TXT",
+        "  python catalog.py --verbose --tokenize # Run with verbose logging and token counting",
+        "  python catalog.py --convert --tokenize # Extract text and count tokens",
+        "  python identify.py                    # Rename PDFs in buffer folder using LLM",
+        "  python transcribe.py                  # Download transcripts from YouTube videos",
+        "  python catalog.py --search             # Search for files by filename in the SQLite database",
+        "  python catalog.py --help               # Display this help message and exit",
+        "",
+    ])
+    # Emit the whole help screen in a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """
@@ -75,6 +73,7 @@ def main():
         --search: Search for files by filename in the SQLite database
         --backupdb: Backup the SQLite database before making changes
         --find-duplicates: Find and save potential duplicate files to CSV
+        --incremental-only-changed: Skip the incremental update if the library root's mtime matches the last run
         --profile: Library profile to use (from folder_paths.json)
         --help: Display this help message and exit
     Outputs: None
@@ -85,12 +84,13 @@ def main():
     """
     # Short-circuit recommend flag before parsing other flags to avoid unrecognized argument errors
     if "--recommend" in sys.argv:
-        # Invoke the standalone recommendation script
-        from subprocess import run
+        # Run the standalone recommendation entry point in this process instead of a second interpreter
+        from recommend import main as recommend_main
         script = Path(__file__).resolve().parent / "recommend.py"
         # Remove the --recommend flag before passing through
         args_to_pass = [arg for arg in sys.argv[1:] if arg != "--recommend"]
-        run([sys.executable, str(script)] + args_to_pass)
+        sys.argv = [str(script)] + args_to_pass
+        recommend_main()
         sys.exit(0)
     parser = argparse.ArgumentParser(description="Library Manager Lite", add_help=False)
     parser.add_argument("--recatalog", action="store_true", help="Force regenerate catalog from scratch (full refresh)")
@@ -102,6 +102,7 @@ def main():
     parser.add_argument("--search", action="store_true", help="Search for files by filename in the SQLite database")
     parser.add_argument("--backupdb", action="store_true", help="Backup the SQLite database before making changes")
     parser.add_argument("--find-duplicates", action="store_true", help="Find and save potential duplicate files to CSV")
+    parser.add_argument("--incremental-only-changed", action="store_true", help="Skip the incremental update if the library root is unchanged since the last run")
     parser.add_argument("--help", "-h", action="store_true", help="Display this help message and exit")
     # Add profile selection argument
     add_profile_arg(parser)
@@ -116,16 +117,24 @@ def main():
         display_help(parser)
         sys.exit(0)
 
-    if args.find_duplicates:
+    # Profile config is parsed from folder_paths.json once and shared by all handlers
+    loaded_config = {}
+
+    def get_profile_config():
+        if "profile" not in loaded_config:
+            loaded_config["profile"] = load_profile_config(args=args)
+        return loaded_config["profile"]
+
+    # Handlers for CLI actions
+    def handle_find_duplicates():
         from core.duplicate_finder import find_and_save_duplicates
         profile = getattr(args, 'profile', 'default')
         find_and_save_duplicates(profile=profile)
-        sys.exit(0)
 
-    # Dispatch table for CLI actions
     def handle_recatalog():
+        from core.catalog_files import run_catalog_workflow
         # Load profile-specific config
-        profile_config = load_profile_config(args=args)
+        profile_config = get_profile_config()
         # When --recatalog is used, convert and tokenize are implicitly True
         run_catalog_workflow(profile_config, verbose=args.verbose, tokenize=True, force_new=True, convert=True, backup_db=args.backupdb)
         # Run analysis by default after recataloging
@@ -138,8 +147,9 @@ def main():
         
         # Use concise output by default, detailed output if explicitly requested with --analysis
         use_concise = not (args.analysis and not force_run)
+        from core.catalog_analyzer import analyze_catalog
         # Load profile-specific config
-        profile_config = load_profile_config(args=args)
+        profile_config = get_profile_config()
         analyze_catalog(output_mode="print", verbose=args.verbose, concise=use_concise, profile_config=profile_config)
 
     # Note: PDF identification functionality is now in identify.py
@@ -154,27 +164,39 @@ def main():
             print("RETURNED VALUE:", results)
             
     def handle_incremental():
+        from core.catalog_files import run_catalog_workflow, root_unchanged_since_last_run
         # Load profile-specific config
-        profile_config = load_profile_config(args=args)
+        profile_config = get_profile_config()
+        if args.incremental_only_changed and root_unchanged_since_last_run(profile_config, verbose=args.verbose):
+            print("[INFO] No changes detected in the library root since the last run; skipping catalog update")
+            handle_analysis()
+            return
         # Always enable convert and tokenize for incremental updates
         run_catalog_workflow(profile_config, verbose=args.verbose, tokenize=True, force_new=False, convert=True, backup_db=args.backupdb)
         # Run analysis by default after incremental update
         handle_analysis()
 
     # Help flag already handled above
-    # Dispatch logic
-    if args.search:
-        try:
-            handle_search()
-        except Exception as e:
-            print(str(e))
-            sys.exit(1)
-        sys.exit(0)
-    elif args.recatalog:
-        handle_recatalog()
-    elif args.analysis:
+    # Dispatch table: (flag attribute, handler, print errors and exit 1 instead of raising).
+    # The first flag that is set wins; with none set, run the incremental update.
+    dispatch = [
+        ("find_duplicates", handle_find_duplicates, False),
+        ("search", handle_search, True),
+        ("recatalog", handle_recatalog, False),
         # Only run analysis if explicitly requested
-        handle_analysis(force_run=True)
+        ("analysis", lambda: handle_analysis(force_run=True), False),
+    ]
+    for flag, handler, report_errors in dispatch:
+        if getattr(args, flag):
+            if report_errors:
+                try:
+                    handler()
+                except Exception as e:
+                    print(str(e))
+                    sys.exit(1)
+            else:
+                handler()
+            break
     else:
         handle_incremental()
 
@@ -8,36 +8,19 @@ Abstract Spec: Recursively scan root, catalog all files except system/excluded f
 """
 
 import os
+import stat
+import hashlib
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import json
-from core.extract_text import extract_and_save
+from core.extract_text import extract_and_save_many
 from ports.convertMDtoTXT import convert_md_to_txt
 from ports.convertVTTtoTXT import extract_vtt_to_txt
-from core.file_utils import get_file_extension
-from core.token_counter import count_tokens
-from core.log_utils import log_event
+from core.token_counter import count_tokens_batch
+from core.log_utils import log_event, init_log_worker, get_log_path
 from adapters.save_to_sqlite import save_dataframe_to_sqlite
 
-def get_file_size_in_mb(file_path: str) -> float:
-    """
-    Purpose: Extract the size of a file in MB, rounded to 3 decimal places.
-    Inputs:
-        file_path (str): Path to the file whose size we need to calculate.
-    Outputs:
-        file_size_in_mb (float): Size of the file in MB (returns 0.0 if file doesn't exist or error occurs). Value is always rounded to 3 decimal places.
-    Role: Robustly retrieves file size for cataloging. Centralizes error handling. Precision is enforced for catalog consistency.
-    """
-    import os
-    try:
-        if os.path.isfile(file_path):
-            return round(os.path.getsize(file_path) / (1024 * 1024), 3)
-        return 0.0
-    except Exception as e:
-        print(f"[ERROR] Error calculating file size for {file_path}: {e}")
-        return 0.0
-
-
 def load_config(config_path: Path) -> dict:
     """
     Purpose: Load and validate user config from JSON.
@@ -58,58 +41,48 @@ def load_config(config_path: Path) -> dict:
         'excluded_files': excluded_files
     }
 
-def is_excluded(abs_file_path: Path, excluded: set, root: Path) -> bool:
+def split_excluded(excluded: set) -> tuple:
     """
-    Returns True if the file or any parent folder matches an entry in excluded (folders end with /).
+    Purpose: Split config exclusions into bare file names and bare folder names.
+    Inputs: excluded (set) - entries from excluded_files; folders end with /
+    Outputs: (exc_files (frozenset), exc_dirs (frozenset))
+    Role: Done once per scan so is_excluded is plain hash lookups.
     """
-    rel = abs_file_path.relative_to(root)
-    # Check file itself
-    if rel.name in excluded:
-        return True
-    # Check parent folders
-    parts = rel.parts
-    for i in range(len(parts)):
-        folder = parts[i]
-        folder_key = folder + '/'  # convention: folders end with /
-        if folder_key in excluded:
-            return True
-    return False
+    exc_dirs = frozenset(x.rstrip('/') for x in excluded if x.endswith('/'))
+    exc_files = frozenset(x for x in excluded if not x.endswith('/'))
+    return exc_files, exc_dirs
 
-
-def load_or_init_catalog(root: Path, catalog_folder: str) -> pd.DataFrame:
+def is_excluded(rel_parts: tuple, name: str, exc_files: frozenset, exc_dirs: frozenset) -> bool:
     """
-    Purpose: Load existing catalog from SQLite (preferred), or initialize new DataFrame if not found.
-    Inputs: root (Path), catalog_folder (str)
-    Outputs: catalog (pd.DataFrame)
-    Role: Ensures catalog is always available for update. SQLite is primary store.
+    Returns True if the file name or any parent folder in rel_parts is excluded (see split_excluded).
     """
-    import sqlite3
-    catalog_dir = catalog_folder
-    db_path = catalog_dir / 'library.sqlite'
-    if db_path.exists():
-        try:
-            conn = sqlite3.connect(str(db_path))
-            catalog = pd.read_sql("SELECT * FROM catalog", conn)
-            conn.close()
-            return catalog
-        except Exception as e:
-            print(f"[ERROR] Failed to load from SQLite: {e}")
-    # fallback to empty DataFrame
-    cols = ['relative_path', 'filename', 'extension', 'last_modified', 'file_size_in_MB', 'textracted', 'token_count', 'sha256']
-    return pd.DataFrame(columns=cols)
+    return name in exc_files or any(p in exc_dirs for p in rel_parts)
+
+
+CATALOG_DTYPES = {
+    'relative_path': 'string',
+    'filename': 'string',
+    'extension': 'string',
+    'textracted': 'boolean',
+    'token_count': 'Int64',
+}
+
+
+def _apply_catalog_dtypes(catalog: pd.DataFrame) -> pd.DataFrame:
     """
-    Purpose: Load existing catalog or initialize new DataFrame.
-    Inputs: root (Path), catalog_folder (str)
-    Outputs: catalog (pd.DataFrame)
-    Role: Ensures catalog is always available for update.
+    Purpose: Cast the key, textracted and token_count columns to compact pandas dtypes.
+    Inputs: catalog (pd.DataFrame)
+    Outputs: catalog (pd.DataFrame) with CATALOG_DTYPES applied to the columns it has
+    Role: Avoids object-dtype columns of mixed ''/int/None values. Accepts textracted from any source
+          (bool, SQLite 0/1, CSV 'True') and token_count stored as text; unparseable counts become <NA>.
     """
-    catalog_dir = catalog_folder
-    catalog_dir.mkdir(parents=True, exist_ok=True)
-    catalog_path = catalog_dir / 'latest-catalog.csv'
-    if catalog_path.exists():
-        return pd.read_csv(catalog_path)
-    cols = ['relative_path', 'filename', 'extension', 'last_modified', 'file_size_in_MB', 'textracted', 'token_count']
-    return pd.DataFrame(columns=cols)
+    catalog = catalog.copy()
+    if 'textracted' in catalog.columns:
+        catalog['textracted'] = catalog['textracted'].isin([True, 1, 'True', '1'])
+    if 'token_count' in catalog.columns:
+        catalog['token_count'] = pd.to_numeric(catalog['token_count'], errors='coerce')
+    return catalog.astype({col: dtype for col, dtype in CATALOG_DTYPES.items() if col in catalog.columns})
+
 
 def get_first_level_subdir(root: Path, file_path: Path) -> Path:
     """
@@ -126,254 +99,499 @@ def get_first_level_subdir(root: Path, file_path: Path) -> Path:
         return root / parts[0]
 
 EXCLUDED_FILES = {'.DS_Store', 'Thumbs.db', 'desktop.ini'}
+TOKEN_BATCH_SIZE = 32  # TXT files per token-counting worker call
+EMPTY_SHA256 = hashlib.sha256(b'').hexdigest()  # Hash of an empty TXT, e.g. from a scanned PDF with no text layer
+
+
+def _walk_file_entries(root: Path, extract_folder: str):
+    """
+    Purpose: Walk root top-down with os.scandir, skipping every extract_folder directory.
+    Inputs: root (Path), extract_folder (str)
+    Outputs: yields (dirpath (str), file_entries (list of os.DirEntry)) per directory
+    Role: Same traversal as os.walk(root) with extract folders pruned, but hands back DirEntry objects so
+          callers reuse their cached type and stat information. Symlinked directories are not followed.
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        file_entries = []
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        file_entries.append(entry)
+                    elif entry.name != extract_folder and not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            # Unreadable directory; os.walk skips these silently too
+            continue
+        yield dirpath, file_entries
+        # Reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def _scan_textracted_dirs(root: Path, extract_folder: str) -> dict:
+    """
+    Purpose: List the TXT files in root/extract_folder and every root/<first-level>/extract_folder exactly once.
+    Inputs: root (Path), extract_folder (str)
+    Outputs: txt_mapping (dict) - (top_level, basename) -> txt_path (str); root-level extracts use extract_folder as top_level
+    Role: Replaces per-PDF exists() checks with set lookups. Extraction only ever writes to these locations.
+    """
+    txt_mapping = {}
+    candidates = [(extract_folder, root / extract_folder)]
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.name != extract_folder and entry.is_dir():
+                    candidates.append((entry.name, Path(entry.path) / extract_folder))
+    except OSError:
+        return txt_mapping
+    for top_level, extract_dir in candidates:
+        try:
+            with os.scandir(extract_dir) as it:
+                for entry in it:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext.lower() == '.txt' and entry.is_file():
+                        txt_mapping[(top_level, name)] = entry.path
+        except OSError:
+            # No extract folder under this top-level directory
+            continue
+    return txt_mapping
+
+
+def _extract_pdfs_parallel(pending_extractions: dict, verbose: bool = False) -> dict:
+    """
+    Purpose: Run extract_and_save for every pending PDF across CPU cores.
+    Inputs: pending_extractions (dict) - txt_mapping key -> (pdf path, txt path), verbose (bool)
+    Outputs: extracted (dict) - txt_mapping key -> txt path (str) for each successful extraction
+    Role: Moves CPU-bound PyMuPDF extraction off the directory walk (see extract_and_save_many). Failures are logged per PDF.
+    """
+    log_event(f"[STEP] Extracting text from {len(pending_extractions)} PDFs in parallel", verbose)
+    extracted = {}
+    keys = list(pending_extractions)
+    pairs = [pending_extractions[mapping_key] for mapping_key in keys]
+    for mapping_key, (pdf_path, txt_path), success in zip(keys, pairs, extract_and_save_many(pairs, verbose=verbose)):
+        if success:
+            extracted[mapping_key] = str(txt_path)
+            log_event(f"[CONVERT] Extracted PDF to TXT: {pdf_path} -> {txt_path}", verbose)
+        else:
+            log_event(f"[ERROR] Failed to extract PDF: {pdf_path}", verbose)
+    return extracted
+
+
+def _sha256_for_file(path, verbose: bool = False) -> str:
+    """
+    Purpose: Compute the SHA-256 of a file.
+    Inputs: path (str or Path), verbose (bool)
+    Outputs: sha256 (str) - hex digest, or '' if the file could not be read
+    Role: Hash for records whose hash does not come from the token-counting read.
+    """
+    try:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(8192), b''):
+                h.update(chunk)
+        return h.hexdigest()
+    except Exception as e:
+        log_event(f"[ERROR] SHA-256 failed for {path}: {e}", verbose)
+        return ''
+
+
+def _token_cache_key(txt_path: str, st: os.stat_result = None) -> str:
+    """
+    Purpose: Build the token cache key for a TXT file from its path, mtime and size.
+    Inputs: txt_path (str), st (os.stat_result or None) - stat already taken by the caller, if any
+    Outputs: key (str) - "path:mtime_ns:size"
+    Role: Any edit to the file changes the key, so stale counts are never reused.
+    """
+    if st is None:
+        st = os.stat(txt_path)
+    return f"{txt_path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def load_token_cache(catalog_folder: Path, verbose: bool = False) -> dict:
+    """
+    Purpose: Load the persistent token-count cache from catalog_folder/token-cache.json.
+    Inputs: catalog_folder (Path), verbose (bool)
+    Outputs: token_cache (dict) - cache key -> token count (empty if missing or unreadable)
+    Role: Lets incremental --tokenize runs skip re-counting unchanged TXT files.
+    """
+    cache_path = Path(catalog_folder) / 'token-cache.json'
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            token_cache = json.load(f)
+        log_event(f"[INFO] Loaded {len(token_cache)} cached token counts from {cache_path}", verbose)
+        return token_cache
+    except Exception as e:
+        log_event(f"[ERROR] Failed to load token cache {cache_path}: {e}", verbose)
+        return {}
+
+
+def save_token_cache(token_cache: dict, catalog_folder: Path, verbose: bool = False) -> None:
+    """
+    Purpose: Persist the token-count cache to catalog_folder/token-cache.json.
+    Inputs: token_cache (dict), catalog_folder (Path), verbose (bool)
+    Outputs: None
+    Role: Counterpart to load_token_cache; called from save_catalog.
+    """
+    cache_path = Path(catalog_folder) / 'token-cache.json'
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(token_cache, f)
+        log_event(f"[INFO] Saved {len(token_cache)} token counts to {cache_path}", verbose)
+    except Exception as e:
+        log_event(f"[ERROR] Failed to save token cache {cache_path}: {e}", verbose)
+
+
+def _root_mtime_ns(root: Path):
+    """
+    Purpose: Read the library root's modification time.
+    Inputs: root (Path)
+    Outputs: mtime_ns (int or None) - None if the root cannot be stat'ed
+    Role: Single stat behind the --incremental-only-changed fast path.
+    """
+    try:
+        return os.stat(root).st_mtime_ns
+    except OSError:
+        return None
+
+
+def save_run_stamp(catalog_folder: Path, root: Path, root_mtime_ns: int, verbose: bool = False) -> None:
+    """
+    Purpose: Record the library root's mtime for a completed catalog run in catalog_folder/last-run-stamp.json.
+    Inputs: catalog_folder (Path), root (Path), root_mtime_ns (int) - taken before the scan started, verbose (bool)
+    Outputs: None
+    Role: Counterpart to root_unchanged_since_last_run; called at the end of run_catalog_workflow.
+    """
+    stamp_path = Path(catalog_folder) / 'last-run-stamp.json'
+    try:
+        with open(stamp_path, 'w', encoding='utf-8') as f:
+            json.dump({str(root): root_mtime_ns}, f)
+        log_event(f"[INFO] Saved run stamp to {stamp_path}", verbose)
+    except Exception as e:
+        log_event(f"[ERROR] Failed to save run stamp {stamp_path}: {e}", verbose)
+
+
+def root_unchanged_since_last_run(profile_config: dict, verbose: bool = False) -> bool:
+    """
+    Purpose: Check whether the library root's mtime still matches the stamp from the last catalog run.
+    Inputs: profile_config (dict from user_inputs/folder_paths.json), verbose (bool)
+    Outputs: unchanged (bool) - False if there is no stamp or the root cannot be stat'ed
+    Role: One stat instead of a full walk for repeated runs. Only files added, removed or renamed directly
+          in the root change its mtime; deeper edits need a normal incremental run or --recatalog.
+    """
+    root = Path(profile_config['root_folder_path'])
+    stamp_path = Path(profile_config['catalog_folder']) / 'last-run-stamp.json'
+    root_mtime_ns = _root_mtime_ns(root)
+    if root_mtime_ns is None or not stamp_path.exists():
+        return False
+    try:
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            stamp = json.load(f)
+    except Exception as e:
+        log_event(f"[ERROR] Failed to load run stamp {stamp_path}: {e}", verbose)
+        return False
+    return stamp.get(str(root)) == root_mtime_ns
+
+
+def _count_tokens_parallel(token_counts: list, sha256s: list, tokens_to_do: list, token_cache: dict, verbose: bool = False) -> None:
+    """
+    Purpose: Count tokens for queued TXT files across CPU cores and write results back into the token_count column.
+    Inputs: token_counts (list) - token_count column, sha256s (list) - sha256 column,
+            tokens_to_do (list of (record index, txt path, cache key, with_sha256) tuples), token_cache (dict), verbose (bool)
+    Outputs: None (updates token_counts[i], sha256s[i] for with_sha256 entries, and token_cache in place)
+    Role: Moves CPU-bound token counting off the directory walk. Files that also need a hash are hashed from the
+          same read. Failures are logged per file and leave token_count empty; a hash owed by a failed
+          read is taken separately, so undecodable files still take part in duplicate detection.
+    """
+    log_event(f"[STEP] Counting tokens for {len(tokens_to_do)} TXT files in parallel", verbose)
+    # Hand files to workers in groups so many small TXTs do not pay one round-trip each;
+    # a batch is either all count-only or all count-and-hash
+    batches = []
+    for with_sha256 in (False, True):
+        group = [item for item in tokens_to_do if item[3] == with_sha256]
+        batches.extend((group[start:start + TOKEN_BATCH_SIZE], with_sha256) for start in range(0, len(group), TOKEN_BATCH_SIZE))
+
+    def _store_results(batch, batch_results):
+        for (i, txt_path, key, with_sha256), result in zip(batch, batch_results):
+            if result is None:
+                # count_tokens_batch has already logged the file and the cause of the failure
+                token_counts[i] = None
+                if with_sha256:
+                    # The hash was owed to this read; a file that cannot be decoded still has one
+                    sha256s[i] = _sha256_for_file(txt_path, verbose)
+                continue
+            if with_sha256:
+                token_count, sha256s[i] = result
+            else:
+                token_count = result
+            token_counts[i] = token_count
+            if key is not None:
+                token_cache[key] = token_count
+
+    if len(batches) == 1:
+        # A single batch (the usual incremental run with a warm token cache) is not worth starting a pool for
+        batch, with_sha256 = batches[0]
+        try:
+            batch_results = count_tokens_batch([txt_path for _, txt_path, _, _ in batch], with_sha256=with_sha256, verbose=verbose)
+        except Exception as e:
+            batch_results = [None] * len(batch)
+            log_event(f"[ERROR] Token counting batch failed: {e}", verbose)
+        _store_results(batch, batch_results)
+        return
+    # count_tokens_batch keeps its default of one thread: each process already owns a core, and decoding and
+    # word counting hold the GIL, so extra threads per worker would only contend
+    with ProcessPoolExecutor(max_workers=min(len(batches), os.cpu_count() or 1),
+                             initializer=init_log_worker, initargs=(get_log_path(),)) as executor:
+        futures = {
+            executor.submit(count_tokens_batch, [txt_path for _, txt_path, _, _ in batch], with_sha256=with_sha256, verbose=verbose): batch
+            for batch, with_sha256 in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                batch_results = [None] * len(batch)
+                log_event(f"[ERROR] Token counting batch failed: {e}", verbose)
+            _store_results(batch, batch_results)
+
 
 def scan_and_update_catalog(
-    root: Path, extract_folder: str, catalog: pd.DataFrame, excluded_files: set = None, verbose: bool = False, tokenize: bool = False, convert: bool = False
+    root: Path, extract_folder: str, excluded_files: set = None, verbose: bool = False, tokenize: bool = False, convert: bool = False,
+    token_cache: dict = None
 ) -> pd.DataFrame:
     """
     Purpose: Scan files, update catalog, and (when convert=True) convert .md and .pdf files to .txt if not already present.
-    Inputs: root (Path), extract_folder (str), catalog (DataFrame), excluded_files (set), verbose (bool), tokenize (bool), convert (bool)
-    Outputs: Updated catalog DataFrame
+    Inputs: root (Path), extract_folder (str), excluded_files (set), verbose (bool), tokenize (bool), convert (bool),
+            token_cache (dict) - (path, mtime, size) keyed token counts; updated in place
+    Outputs: Updated catalog DataFrame, built from this scan alone
     Role: Core catalog and conversion routine. When convert=True, ensures all .md and .pdf files are converted to .txt as needed.
     """
-    from core.log_utils import log_event
-    from ports.convertMDtoTXT import convert_md_to_txt
-    from core.extract_text import extract_and_save
     log_event("[START] scan_and_update_catalog", verbose)
 
     if excluded_files is None:
         excluded_files = set()
-    records = []
-
-    import hashlib
-
-    def _sha256_for_file(path):
+    exc_files, exc_dirs = split_excluded(excluded_files)
+    # Records are collected column-wise (one list per catalog column) and handed to pandas as-is
+    ordered_cols = ['relative_path', 'filename', 'extension', 'last_modified', 'file_size_in_MB', 'textracted', 'token_count', 'sha256']
+    columns = {col: [] for col in ordered_cols}
+    col_rp, col_fn, col_ext = columns['relative_path'], columns['filename'], columns['extension']
+    col_lm, col_size, col_sha = columns['last_modified'], columns['file_size_in_MB'], columns['sha256']
+    col_tx, col_tc = columns['textracted'], columns['token_count']
+    tokens_to_do = []  # (record index, txt path, cache key, with_sha256) tuples, tokenized after the walk
+    queued_keys = {}  # cache key -> index into tokens_to_do, so each TXT is read at most once per run
+    token_followers = []  # (record index, tokens_to_do index, with_sha256) reusing another record's read
+    if token_cache is None:
+        token_cache = {}
+    used_cache_keys = set()
+    pending_extractions = {}  # txt_mapping key -> (pdf path, txt path), extracted after the walk
+    pending_records = []  # (record index, txt_mapping key) for PDFs waiting on extraction
+
+    def _append_record(relative_path, filename, extension, last_modified, file_size_in_MB, textracted, sha256):
+        col_rp.append(relative_path)
+        col_fn.append(filename)
+        col_ext.append(extension)
+        col_lm.append(last_modified)
+        col_size.append(file_size_in_MB)
+        col_tx.append(textracted)
+        col_tc.append(None)
+        col_sha.append(sha256)
+        return len(col_rp) - 1
+
+    def _queue_token_count(record_index, txt_path, st=None, with_sha256=False):
+        # Reuse the cached count when the TXT is unchanged since the last run.
+        # with_sha256: the record's hash is still owed and is taken from the token-counting read.
         try:
-            h = hashlib.sha256()
-            with open(path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    h.update(chunk)
-            return h.hexdigest()
-        except Exception as e:
-            log_event(f"[ERROR] SHA-256 failed for {path}: {e}", verbose)
-            return ''
-
-    # --- Step 1: Build mapping of all .txt in any extract_folder folders ---
-    txt_mapping = {}  # (top_level, basename) -> txt_path
-    for dirpath, dirs, files in os.walk(root):
-        if os.path.basename(dirpath) == extract_folder:
-            rel_parts = Path(os.path.relpath(dirpath, root)).parts
-            top_level = rel_parts[0] if len(rel_parts) > 0 else '.'
-            for f in files:
-                name, ext = os.path.splitext(f)
-                if ext.lower() == '.txt':
-                    txt_mapping[(top_level, name)] = Path(dirpath) / f
+            if st is None:
+                st = os.stat(txt_path)
+            key = _token_cache_key(txt_path, st)
+        except OSError as e:
+            log_event(f"[ERROR] Could not stat {txt_path} for token cache: {e}", verbose)
+            key = None
+        if key is not None and st.st_size == 0 and stat.S_ISREG(st.st_mode):
+            # An empty file has no words or characters; its count (and hash) are known without opening it
+            col_tc[record_index] = 0
+            if with_sha256:
+                col_sha[record_index] = EMPTY_SHA256
+            return
+        if key is not None:
+            used_cache_keys.add(key)
+            if key in token_cache:
+                col_tc[record_index] = token_cache[key]
+                if with_sha256:
+                    col_sha[record_index] = _sha256_for_file(txt_path, verbose)
+                return
+            # A PDF record and the extracted TXT's own record point at the same file; count it once
+            if key in queued_keys:
+                pos = queued_keys[key]
+                leader = tokens_to_do[pos]
+                if with_sha256 and not leader[3]:
+                    # Let the record that owes a hash do the read, so the hash comes from it as well
+                    tokens_to_do[pos] = (record_index, txt_path, key, True)
+                    token_followers.append((leader[0], pos, False))
+                else:
+                    token_followers.append((record_index, pos, with_sha256))
+                return
+            queued_keys[key] = len(tokens_to_do)
+        tokens_to_do.append((record_index, txt_path, key, with_sha256))
+
+    # --- Step 1: Build mapping of all .txt in the first-level extract_folder folders ---
+    txt_mapping = _scan_textracted_dirs(root, extract_folder)  # (top_level, basename) -> txt_path
     log_event(f"[DEBUG] Built txt_mapping with {len(txt_mapping)} entries", verbose)
 
     # --- Step 2: Main scan loop ---
-    for dirpath, dirs, files in os.walk(root):
-        log_event(f"[SCAN] Entering directory: {dirpath}", verbose)
-        if extract_folder in dirs:
-            dirs.remove(extract_folder)
-        for f in files:
-            abs_file_path = Path(dirpath) / f
-            log_event(f"[SCAN] Considering file: {abs_file_path} (ext: {os.path.splitext(f)[1]})", verbose)
-            # Extra: log if .txt in any extract_folder folder
-            if os.path.splitext(f)[1].lower() == '.txt' and (
-                extract_folder in Path(dirpath).parts or Path(dirpath).name == extract_folder
-            ):
-                log_event(f"[DEBUG] Found TXT in {extract_folder}: {abs_file_path} (rel_dir={os.path.relpath(dirpath, root)})", verbose)
+    for dirpath, file_entries in _walk_file_entries(root, extract_folder):
+        if verbose:
+            log_event(f"[SCAN] Entering directory: {dirpath}", True)
+        dir_files = {entry.name for entry in file_entries}
+        # Path facts depend only on the directory, so compute them once per directory
+        dir_path = Path(dirpath)
+        rel_dir = os.path.relpath(dirpath, root)
+        rel_parts = Path(rel_dir).parts if rel_dir != '.' else ()
+        top_level = rel_parts[0] if len(rel_parts) > 0 else '.'
+        # Root-level PDFs map to root/extract_folder, all others to their first-level folder
+        mapping_top_level = extract_folder if top_level == '.' else top_level
+        for entry in file_entries:
+            f = entry.name
+            abs_file_path = entry.path  # str from scandir; reused as-is for hashing and token keys
+            # Split the name once; extension matches get_file_extension (no leading dot)
+            name, dot_ext = os.path.splitext(f)
+            extension = dot_ext[1:]
+            ext_lower = extension.lower()
+            is_pdf = ext_lower == 'pdf'
+            is_txt = ext_lower == 'txt'
+            # Per-file messages are only formatted when verbose logging is on
+            if verbose:
+                log_event(f"[SCAN] Considering file: {abs_file_path} (ext: {dot_ext})", True)
 
             if f in EXCLUDED_FILES:
-                log_event(f"File skipped (excluded): {abs_file_path}", verbose)
+                if verbose:
+                    log_event(f"File skipped (excluded): {abs_file_path}", True)
                 continue
 
-            if excluded_files and is_excluded(abs_file_path, excluded_files, root):
-                log_event(f"File skipped (excluded by config): {abs_file_path}", verbose)
+            if excluded_files and is_excluded(rel_parts, f, exc_files, exc_dirs):
+                if verbose:
+                    log_event(f"File skipped (excluded by config): {abs_file_path}", True)
                 continue
 
-            name, ext = os.path.splitext(f)
-            rel_dir = os.path.relpath(dirpath, root)
-            extension = get_file_extension(f)
-
             # --- Conversion logic: convert .md and .pdf to .txt if needed ---
             if convert:
                 # For .md files: convert to .txt in same folder if not present
-                if extension.lower() == 'md':
-                    txt_path = Path(dirpath) / (name + '.txt')
-                    if not txt_path.exists():
+                if ext_lower == 'md':
+                    txt_path = dir_path / (name + '.txt')
+                    if (name + '.txt') not in dir_files:
                         try:
-                            convert_md_to_txt(str(abs_file_path), verbose=verbose)
+                            convert_md_to_txt(abs_file_path, verbose=verbose)
                             log_event(f"[CONVERT] Converted MD to TXT: {abs_file_path} -> {txt_path}", verbose)
                         except Exception as e:
                             log_event(f"[ERROR] Failed to convert MD: {abs_file_path}: {e}", verbose)
                 # For .pdf files: extract text to extract_folder if not present
-                elif extension.lower() == 'pdf':
+                elif is_pdf:
                     # Place extracted .txt in extract_folder under the same top-level
-                    rel_parts = Path(rel_dir).parts if rel_dir != '.' else ()
-                    top_level = rel_parts[0] if len(rel_parts) > 0 else '.'
                     # Build textracted path: root/top_level/extract_folder/name.txt
                     extract_dir = root / top_level / extract_folder
-                    extract_dir.mkdir(parents=True, exist_ok=True)
                     txt_path = extract_dir / (name + '.txt')
-                    if not txt_path.exists():
-                        try:
-                            extract_and_save(abs_file_path, txt_path, verbose=verbose)
-                            log_event(f"[CONVERT] Extracted PDF to TXT: {abs_file_path} -> {txt_path}", verbose)
-                            # --- Update txt_mapping for immediate detection ---
-                            rel2 = os.path.relpath(extract_dir, root)
-                            parts2 = Path(rel2).parts if rel2 != '.' else ()
-                            mtop = parts2[0] if len(parts2) > 0 else '.'
-                            txt_mapping[(mtop, name)] = txt_path
-                        except Exception as e:
-                            log_event(f"[ERROR] Failed to extract PDF: {abs_file_path}: {e}", verbose)
+                    mapping_key = (mapping_top_level, name)
+                    if mapping_key not in txt_mapping:
+                        # Defer extraction to the process pool; the record is patched after the walk
+                        if mapping_key not in pending_extractions:
+                            try:
+                                extract_dir.mkdir(parents=True, exist_ok=True)
+                                pending_extractions[mapping_key] = (Path(abs_file_path), txt_path)
+                            except Exception as e:
+                                log_event(f"[ERROR] Failed to create extract folder {extract_dir}: {e}", verbose)
+                        pending_records.append((len(col_rp), mapping_key))
 
-            # --- NEW: Catalog .txt files in extract_folder folders ---
-            in_textracted = (
-                extract_folder in Path(dirpath).parts or Path(dirpath).name == extract_folder
-            )
+            # One stat per file (cached on the DirEntry) feeds last_modified, size and the token cache key
             try:
-                last_modified = os.path.getmtime(abs_file_path)
-                last_modified_str = pd.to_datetime(last_modified, unit='s').strftime('%Y-%m-%d %H:%M:%S')
+                st = entry.stat()
+                last_modified_str = pd.to_datetime(st.st_mtime, unit='s').strftime('%Y-%m-%d %H:%M:%S')
             except Exception as e:
+                st = None
                 last_modified_str = ''
                 log_event(f"[ERROR] Could not get last_modified for {abs_file_path}: {e}", verbose)
             # Calculate file_size_in_MB for all files by default
-            file_size_in_MB = get_file_size_in_mb(abs_file_path)
-
-            # Always catalog .txt files in any extract_folder folder (including root/extract_folder)
-            if extension.lower() == 'txt' and (
-                extract_folder in Path(dirpath).parts or Path(dirpath).name == extract_folder
-            ):
-                rel_parts = Path(rel_dir).parts if rel_dir != '.' else ()
-                if rel_dir == extract_folder:
-                    top_level = extract_folder
-                else:
-                    top_level = rel_parts[0] if len(rel_parts) > 0 else '.'
-                pdf_match = catalog[
-                    (catalog['relative_path'].str.split(os.sep).str[0] == top_level)
-                    & (catalog['filename'] == name)
-                    & (catalog['extension'].str.lower() == 'pdf')
-                ]
-                if not pdf_match.empty:
-                    file_size_in_MB = ''
-                # Always mark as textracted and ensure record is added
-                record = {
-                    'relative_path': rel_dir,
-                    'filename': name,
-                    'extension': extension,
-                    'last_modified': pd.to_datetime(os.path.getmtime(abs_file_path), unit='s').strftime('%Y-%m-%d %H:%M:%S'),
-                    'file_size_in_MB': file_size_in_MB,
-                    'textracted': True,
-                    'token_count': '',
-                    'sha256': ''
-                }
-                if tokenize:
-                    log_event(f"[DEBUG] About to count tokens for TXT: {abs_file_path}", verbose)
-                    try:
-                        token_count = count_tokens(str(abs_file_path))
-                        record['token_count'] = token_count
-                    except Exception as e:
-                        record['token_count'] = ''
-                        log_event(f"[ERROR] Token counting failed for {abs_file_path}: {e}", verbose)
-                records.append(record)
-                log_event(f"[DEBUG] Appended TXT record: rel_path={record['relative_path']} filename={record['filename']} textracted={record['textracted']}", verbose)
-                continue  # Prevent duplicate record for same file
-
-            record = {
-                'relative_path': rel_dir,
-                'filename': name,
-                'extension': extension,
-                'last_modified': pd.to_datetime(os.path.getmtime(abs_file_path), unit='s').strftime('%Y-%m-%d %H:%M:%S'),
-                'file_size_in_MB': file_size_in_MB,
-                'textracted': False,
-                'token_count': '',
-                'sha256': _sha256_for_file(abs_file_path)
-            }
+            file_size_in_MB = round(st.st_size / (1024 * 1024), 3) if st is not None and stat.S_ISREG(st.st_mode) else 0.0
+
+            # TXTs that will be tokenized get their hash from the same read (see _queue_token_count)
+            fuse_sha256 = is_txt and tokenize
+            i = _append_record(rel_dir, name, extension, last_modified_str, file_size_in_MB, False,
+                               '' if fuse_sha256 else _sha256_for_file(abs_file_path, verbose))
 
             # --- PDF logic: set textracted if mapping exists ---
-            rel_parts = Path(rel_dir).parts if rel_dir != '.' else ()
-            top_level = rel_parts[0] if len(rel_parts) > 0 else '.'
-            if extension.lower() == 'pdf':
+            if is_pdf:
                 # If PDF is in root, look for .txt in (extract_folder, name)
-                if rel_dir == '.':
-                    key = (extract_folder, name)
-                else:
-                    key = (top_level, name)
+                key = (mapping_top_level, name)
                 if key in txt_mapping:
-                    record['textracted'] = True
+                    col_tx[i] = True
                     if tokenize:
                         txt_path = txt_mapping[key]
-                        log_event(f"[DEBUG] Counting tokens for PDF-associated TXT: {txt_path}", verbose)
-                        if txt_path.exists():
-                            try:
-                                token_count = count_tokens(str(txt_path))
-                                record['token_count'] = token_count
-                            except Exception as e:
-                                record['token_count'] = ''
-                                log_event(f"[ERROR] Token counting failed for PDF-associated TXT {txt_path}: {e}", verbose)
-                        else:
-                            record['token_count'] = ''
-                            log_event(f"[ERROR] Associated TXT file does not exist: {txt_path}", verbose)
-
-            # --- TXT in extract_folder: always catalog, always tokenize if flag set ---
-            if extension.lower() == 'txt':
+                        if verbose:
+                            log_event(f"[DEBUG] Queued token count for PDF-associated TXT: {txt_path}", True)
+                        # txt_mapping only holds TXT files listed or written during this run
+                        _queue_token_count(i, txt_path)
+
+            # --- TXT outside extract folders: tokenize if flag set ---
+            if fuse_sha256:
+                if verbose:
+                    log_event(f"[DEBUG] Queued token count for TXT: {abs_file_path}", True)
+                _queue_token_count(i, abs_file_path, st, with_sha256=True)
+
+    # --- Step 2a: Extract text from new PDFs in parallel, then mark their records ---
+    if pending_extractions:
+        txt_mapping.update(_extract_pdfs_parallel(pending_extractions, verbose))
+        for i, mapping_key in pending_records:
+            if mapping_key in txt_mapping:
+                col_tx[i] = True
                 if tokenize:
-                    log_event(f"[DEBUG] About to count tokens for TXT: {abs_file_path}", verbose)
-                    try:
-                        token_count = count_tokens(str(abs_file_path))
-                        record['token_count'] = token_count
-                    except Exception as e:
-                        record['token_count'] = ''
-                        log_event(f"[ERROR] Token counting failed for {abs_file_path}: {e}", verbose)
-            records.append(record)
+                    _queue_token_count(i, txt_mapping[mapping_key])
+
+    # --- Step 2b: Count tokens for all queued TXT files in parallel ---
+    if tokens_to_do:
+        _count_tokens_parallel(col_tc, col_sha, tokens_to_do, token_cache, verbose)
+        for i, pos, with_sha256 in token_followers:
+            leader_index = tokens_to_do[pos][0]
+            col_tc[i] = col_tc[leader_index]
+            if with_sha256:
+                col_sha[i] = col_sha[leader_index]
+    # Drop cache entries for TXT files that are gone or have changed
+    for stale_key in set(token_cache) - used_cache_keys:
+        del token_cache[stale_key]
 
     # --- Step 3: Build DataFrame and ensure column order ---
-    new_df = pd.DataFrame(records)
-    ordered_cols = ['relative_path', 'filename', 'extension', 'last_modified', 'file_size_in_MB', 'textracted', 'token_count', 'sha256']
-    for col in ordered_cols:
-        if col not in new_df.columns:
-            new_df[col] = ''
-    new_df = new_df[ordered_cols]
+    new_df = _apply_catalog_dtypes(pd.DataFrame(columns, columns=ordered_cols, copy=False))
 
     #if verbose:
     #    print(f"[DEBUG] New catalog entries:\n{new_df.head()}")
 
-    # --- Merge with old catalog, preferring new records ---
-    dfs = [df for df in [catalog, new_df] if not df.empty]
-    if dfs:
-        updated_catalog = pd.concat(dfs).drop_duplicates(
-            subset=['relative_path', 'filename', 'extension'], keep='last'
-        ).reset_index(drop=True)
-    else:
-        # Both are empty
-        updated_catalog = pd.DataFrame(columns=[
-            'relative_path', 'filename', 'extension', 'last_modified',
-            'file_size_in_MB', 'textracted', 'token_count', 'sha256'])
+    # --- The scan emits exactly one record per present file, so it is the updated catalog ---
+    # Records for files that no longer exist are dropped simply by not being scanned, so the old
+    # catalog is never loaded. TXT files inside extract folders are not cataloged on their own:
+    # the walk prunes those folders and PDFs pick up their TXT through txt_mapping.
+    updated_catalog = new_df.reset_index(drop=True)
 
     if verbose:
-        print(f"[DEBUG] Updated catalog after merge:\n{updated_catalog.head()}")
-
-    # Remove catalog entries for files that no longer exist in the folder tree
-    present_keys = set(
-        (rec['relative_path'], rec['filename'], rec['extension']) for rec in records
-    )
-    updated_catalog = updated_catalog[
-        updated_catalog.apply(
-            lambda row: (row['relative_path'], row['filename'], row['extension']) in present_keys,
-            axis=1
-        )
-    ].reset_index(drop=True)
+        print(f"[DEBUG] Updated catalog after scan:\n{updated_catalog.head()}")
 
     log_event("[END] scan_and_update_catalog", verbose)
     return updated_catalog
 
 
-def save_catalog(catalog: pd.DataFrame, root: Path, catalog_folder: str, verbose: bool = False, backup_db: bool = False, save_csv: bool = False, force_new: bool = False):
+def save_catalog(catalog: pd.DataFrame, root: Path, catalog_folder: str, verbose: bool = False, backup_db: bool = False, save_csv: bool = False, force_new: bool = False,
+                 token_cache: dict = None):
     """
     Purpose: Save catalog DataFrame to CSV and SQLite, ensuring required column order.
-    Inputs: catalog (pd.DataFrame), root (Path), catalog_folder (str), verbose (bool), backup_db (bool)
-    Outputs: None
+    Inputs: catalog (pd.DataFrame), root (Path), catalog_folder (str), verbose (bool), backup_db (bool), token_cache (dict or None)
+    Outputs: saved (bool) - True if the SQLite save succeeded
     Role: Persists the catalog for inspection and incremental runs. All logging is handled via log_utils.py.
     """
     catalog_dir = root / catalog_folder
@@ -389,11 +607,11 @@ def save_catalog(catalog: pd.DataFrame, root: Path, catalog_folder: str, verbose
         catalog.to_csv(catalog_path, index=False)
         log_event(f"Catalog updated at {catalog_path}", verbose)
     # Always save to SQLite
-    from adapters.save_to_sqlite import save_dataframe_to_sqlite
-    save_dataframe_to_sqlite(catalog, root, catalog_folder, verbose=verbose, backup_db=backup_db, force_new=force_new)
-
+    saved = save_dataframe_to_sqlite(catalog, root, catalog_folder, verbose=verbose, backup_db=backup_db, force_new=force_new)
+    if token_cache is not None:
+        save_token_cache(token_cache, catalog_folder, verbose=verbose)
+    return saved
 
-from core.log_utils import log_event
 
 def run_catalog_workflow(profile_config: dict, verbose: bool = False, tokenize: bool = False, force_new: bool = False, convert: bool = False, backup_db: bool = False, save_csv: bool = False):
     """
@@ -412,6 +630,8 @@ def run_catalog_workflow(profile_config: dict, verbose: bool = False, tokenize:
     excluded_files = set(profile_config.get('excluded_files', []))
     log_path = catalog_folder / 'logs.txt'
     set_log_path(str(log_path))
+    # Stat the root before scanning, so changes made during the run are picked up next time
+    root_mtime_ns = _root_mtime_ns(root)
     
     # Create config dict in the format expected by other functions
     config = {
@@ -422,16 +642,15 @@ def run_catalog_workflow(profile_config: dict, verbose: bool = False, tokenize:
     }
     
     catalog_dir = catalog_folder
-    catalog_path = catalog_dir / 'latest-catalog.csv'
     if force_new:
-        # Always create a new empty DataFrame
-        cols = ['relative_path', 'filename', 'extension', 'last_modified', 'file_size_in_MB', 'textracted', 'token_count', 'sha256']
-        catalog = pd.DataFrame(columns=cols)
-        log_event(f"[INFO] Creating new catalog from scratch at {catalog_path}", verbose)
-    else:
-        catalog = load_or_init_catalog(root, catalog_folder)
-        log_event(f"[INFO] Loaded catalog from SQLite or initialized new DataFrame", verbose)
+        log_event(f"[INFO] Creating new catalog from scratch at {catalog_dir / 'library.sqlite'}", verbose)
+    token_cache = load_token_cache(catalog_dir, verbose=verbose) if tokenize else None
     catalog = scan_and_update_catalog(
-        root, extract_path, catalog, excluded_files, verbose=verbose, tokenize=tokenize, convert=convert
+        root, extract_path, excluded_files, verbose=verbose, tokenize=tokenize, convert=convert,
+        token_cache=token_cache
     )
-    save_catalog(catalog, root, catalog_folder, verbose=verbose, backup_db=backup_db, save_csv=save_csv, force_new=force_new)
+    saved = save_catalog(catalog, root, catalog_folder, verbose=verbose, backup_db=backup_db, save_csv=save_csv, force_new=force_new,
+                         token_cache=token_cache)
+    # A failed save must not let --incremental-only-changed skip the next run
+    if saved and root_mtime_ns is not None:
+        save_run_stamp(catalog_folder, root, root_mtime_ns, verbose=verbose)
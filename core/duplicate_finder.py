@@ -2,17 +2,17 @@
 duplicate_finder.py | Detects potential duplicate files in the catalog
 Author: ChAI-Engine
 Last-updated: 2025-06-07
-Non-std deps: pandas, rapidfuzz
-Abstract spec: For each top-level folder in the catalog, find file pairs with identical sizes, then compute token_sort_ratio and Levenshtein distance on filenames. Output results as CSV.
+Non-std deps: pandas, numpy, rapidfuzz
+Abstract spec: For each top-level folder in the catalog, find file pairs with identical sizes, then compute token_sort_ratio and normalized Levenshtein similarity on filenames (rapidfuzz, with score cutoffs). Output results as CSV.
 """
 
 import os
-import sys
-import argparse
-import sqlite3
-import itertools
+import json
+import bisect
+import numpy as np
 import pandas as pd
-from rapidfuzz import fuzz, distance
+from rapidfuzz import fuzz, distance, process
+from core.sqlite_search import get_connection
 
 
 def _load_exclusions():
@@ -41,36 +41,81 @@ def get_file_records(db_path, exclusions=None):
     Purpose: Fetch file records from SQLite database, skipping excluded top_level_folders.
     Inputs: db_path (str) - path to library.sqlite
             exclusions (set or None) - folders to skip
-    Outputs: List of dicts with keys: top_level_folder, filename, file_size, sha256
-    Role: Data extraction for duplicate analysis
+    Outputs: List of dicts with keys: top_level_folder, filename, file_size_MB
+    Role: Data extraction for the size/fuzzy duplicate analysis. sha256 is not fetched here;
+          find_exact_duplicates reads hashes from the index and hydrates only colliding rows.
     """
-    conn = sqlite3.connect(db_path)
+    conn = get_connection(db_path)
     cur = conn.cursor()
-    cur.execute("SELECT relative_path, filename, file_size_in_MB, sha256 FROM catalog")
-    rows = cur.fetchall()
+    cur.execute("SELECT relative_path, filename, file_size_in_MB FROM catalog")
     records = []
-    for rel_path, filename, file_size_MB, sha256 in rows:
+    for rel_path, filename, file_size_MB in cur:
         top_level = os.path.normpath(rel_path).split(os.sep)[0]
         if exclusions and top_level in exclusions:
             continue
         records.append({
             'top_level_folder': top_level,
             'filename': filename,
-            'file_size_MB': file_size_MB,
-            'sha256': sha256
+            'file_size_MB': file_size_MB
         })
-    conn.close()
     return records
 
 
+def find_exact_duplicates(db_path, exclusions=None):
+    """
+    Purpose: Find file pairs with identical sha256, letting SQLite do the grouping.
+    Inputs: db_path (str) - path to library.sqlite
+            exclusions (set or None) - top_level_folders to skip
+    Outputs: Dict of equal-length lists keyed top_level_folder, filename1, filename2, file_size_MB, confidence ('exact')
+    Role: Exact duplicate detection. Only rows whose hash occurs more than once are fetched (via idx_sha256),
+          ordered so each hash's rows are contiguous; hashes are reported in order of their first non-excluded file.
+    """
+    conn = get_connection(db_path)
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT c.rowid, c.relative_path, c.filename, c.file_size_in_MB, c.sha256 FROM catalog c "
+        "JOIN (SELECT sha256, MIN(rowid) AS first_row FROM catalog "
+        "      WHERE sha256 IS NOT NULL AND TRIM(sha256) != '' GROUP BY sha256 HAVING COUNT(*) > 1) d "
+        "ON c.sha256 = d.sha256 ORDER BY d.first_row, c.rowid"
+    )
+    # Pairs are collected column-wise so the caller can build its DataFrame straight from the columns
+    exact_pairs = {'top_level_folder': [], 'filename1': [], 'filename2': [], 'file_size_MB': [], 'confidence': []}
+    groups = []  # (rowid of the first kept file, [(top_level, filename, file_size_MB), ...]) per hash
+    current_sha = None
+    for rowid, rel_path, filename, file_size_MB, sha256 in cur:
+        if sha256 != current_sha:
+            groups.append((None, []))
+            current_sha = sha256
+        top_level = os.path.normpath(rel_path).split(os.sep)[0]
+        # Exclusions apply before pairing, so a hash left with one file yields nothing
+        if exclusions and top_level in exclusions:
+            continue
+        first_kept, group = groups[-1]
+        if first_kept is None:
+            groups[-1] = (rowid, group)
+        group.append((top_level, filename, file_size_MB))
+    # An excluded file can hold a hash's lowest rowid; order hashes by their first kept file instead
+    groups = sorted((g for g in groups if len(g[1]) >= 2), key=lambda g: g[0])
+    for _, group in groups:
+        # All unique pairs for this hash; the first file of each pair supplies folder and size
+        first, second = np.triu_indices(len(group), k=1)
+        folders, filenames, sizes = zip(*group)
+        exact_pairs['top_level_folder'].extend(folders[i] for i in first)
+        exact_pairs['filename1'].extend(filenames[i] for i in first)
+        exact_pairs['filename2'].extend(filenames[j] for j in second)
+        exact_pairs['file_size_MB'].extend(sizes[i] for i in first)
+        exact_pairs['confidence'].extend(['exact'] * len(first))
+    return exact_pairs
+
+
 def find_duplicates(records):
     """
-    Purpose: Identify file pairs in the same top-level folder with identical sizes.
+    Purpose: Group files in the same top-level folder that have identical sizes.
     Inputs: records (list of dicts)
-    Outputs: List of dicts with duplicate pair info
-    Role: Core duplicate detection logic
+    Outputs: List of (top_level_folder, file_size_MB, filenames) tuples, one per group of 2+ files
+    Role: Core duplicate detection logic; candidate pairs are the pairs within each group
     """
-    results = []
+    groups = []
     # Group by top_level_folder
     folders = {}
     for rec in records:
@@ -79,56 +124,105 @@ def find_duplicates(records):
         # Group files by file_size_MB
         size_map = {}
         for f in files:
-            size_map.setdefault(f['file_size_MB'], []).append(f)
-        for size_MB, group in size_map.items():
-            if len(group) < 2:
+            size_map.setdefault(f['file_size_MB'], []).append(f['filename'])
+        for size_MB, filenames in size_map.items():
+            if len(filenames) < 2:
                 continue
-            # All unique pairs
-            for f1, f2 in itertools.combinations(group, 2):
-                results.append({
-                    'top_level_folder': folder,
-                    'filename1': f1['filename'],
-                    'filename2': f2['filename'],
-                    'file_size_MB': size_MB
-                })
-    return results
+            groups.append((folder, size_MB, filenames))
+    return groups
 
 
-def compute_similarity(pairs):
+# Pairs below either threshold are never reported
+MIN_TOKEN_SORT_RATIO = 80
+MIN_NORMALIZED_LEVENSHTEIN = 0.7
+# Rows scored per cdist call, bounding each score matrix to SIMILARITY_BLOCK_ROWS x group size
+SIMILARITY_BLOCK_ROWS = 1024
+
+def compute_similarity(groups):
     """
-    Purpose: Compute token_sort_ratio, normalized Levenshtein ratio, and confidence for each file pair.
-    Inputs: pairs (list of dicts)
-    Outputs: DataFrame with similarity and confidence columns
-    Role: Similarity scoring and classification
+    Purpose: Compute token_sort_ratio, normalized Levenshtein ratio, and confidence for the file pairs in each size group.
+    Inputs: groups (list of (top_level_folder, file_size_MB, filenames) tuples from find_duplicates)
+    Outputs: DataFrame with similarity and confidence columns, one row per pair passing both thresholds
+    Role: Similarity scoring and classification. Each group is scored as a matrix with rapidfuzz.process.cdist
+          (C loop, all cores) instead of one Python call per pair; pairs keep itertools.combinations order.
+          token_sort_ratio is computed as fuzz.ratio on each name's sorted-token form, built once per name.
+          Pairs whose length difference already rules out the Levenshtein threshold are never scored, and
+          normalized Levenshtein is computed (process.cpdist) only for pairs that pass token_sort_ratio.
     """
-    data = []
-    for pair in pairs:
-        fn1 = pair['filename1']
-        fn2 = pair['filename2']
-        tsr = fuzz.token_sort_ratio(fn1, fn2)
-        lev_dist = distance.Levenshtein.distance(fn1, fn2)
-        max_len = max(len(fn1), len(fn2)) or 1
-        norm_lev = 1 - (lev_dist / max_len)
-        # Confidence assignment
-        if tsr >= 90 and norm_lev >= 0.85:
-            confidence = "high"
-        elif tsr >= 80 and norm_lev >= 0.7:
-            confidence = "possible"
-        else:
-            confidence = "unlikely"
-        data.append({
-            'top_level_folder': pair['top_level_folder'],
-            'filename1': fn1,
-            'filename2': fn2,
-            'file_size_MB': pair['file_size_MB'],
-            'token_sort_ratio': tsr,
-            'normalized_levenshtein': norm_lev,
-            'confidence': confidence
-        })
-    return pd.DataFrame(data)
-
+    # Result columns are collected column-wise: numpy chunks per group, plain lists for the repeated group keys
+    col_folder, col_fn1, col_fn2, col_size, col_tsr, col_lev = [], [], [], [], [], []
+    sorted_tokens = {}  # filename -> whitespace tokens sorted and re-joined, as token_sort_ratio does internally
+    for folder, size_MB, names in groups:
+        n = len(names)
+        for fn in names:
+            if fn not in sorted_tokens:
+                sorted_tokens[fn] = " ".join(sorted(fn.split()))
+        # Score names shortest first. Levenshtein distance is at least the length difference, so
+        # normalized_levenshtein >= MIN_NORMALIZED_LEVENSHTEIN needs len(longer) <= len(shorter) / MIN_NORMALIZED_LEVENSHTEIN:
+        # each row block only has to be compared with the window of names up to that length.
+        # (No trigram-overlap prefilter: overlap is not a safe bound at these thresholds, e.g. three edits spread
+        # through a 10-char name can leave no shared trigram while similarity is still 0.7, and a per-pair Python
+        # set test would cost more than rapidfuzz's cutoff-pruned C scoring it is meant to skip.)
+        order = np.array(sorted(range(n), key=lambda k: len(names[k])), dtype=np.intp)
+        by_len = [names[k] for k in order]
+        by_len_arr = np.array(by_len, dtype=object)
+        canon = [sorted_tokens[fn] for fn in by_len]
+        lengths = [len(fn) for fn in by_len]
+        idx1, idx2, tsrs, levs = [], [], [], []
+        for start in range(0, n, SIMILARITY_BLOCK_ROWS):
+            stop = min(start + SIMILARITY_BLOCK_ROWS, n)
+            end = bisect.bisect_right(lengths, int(lengths[stop - 1] / MIN_NORMALIZED_LEVENSHTEIN))
+            if end - start < 2:
+                continue
+            tsr_matrix = process.cdist(canon[start:stop], canon[start:end], scorer=fuzz.ratio, dtype=np.float64,
+                                       score_cutoff=MIN_TOKEN_SORT_RATIO, workers=-1)
+            # Upper triangle only: each unordered pair once, never a file with itself
+            rows, cols = np.nonzero((tsr_matrix >= MIN_TOKEN_SORT_RATIO)
+                                    & (np.arange(start, end)[None, :] > np.arange(start, stop)[:, None]))
+            if not len(rows):
+                continue
+            # Levenshtein is only computed for the pairs that passed the token-sort gate
+            lev_scores = process.cpdist(by_len_arr[start + rows].tolist(), by_len_arr[start + cols].tolist(),
+                                        scorer=distance.Levenshtein.normalized_similarity, dtype=np.float64,
+                                        score_cutoff=MIN_NORMALIZED_LEVENSHTEIN, workers=-1)
+            passing = lev_scores >= MIN_NORMALIZED_LEVENSHTEIN
+            rows, cols = rows[passing], cols[passing]
+            # Both scorers are symmetric, so each pair can be reported in original group order
+            orig_r, orig_c = order[start + rows], order[start + cols]
+            idx1.append(np.minimum(orig_r, orig_c))
+            idx2.append(np.maximum(orig_r, orig_c))
+            tsrs.append(tsr_matrix[rows, cols])
+            levs.append(lev_scores[passing])
+        if not idx1:
+            continue
+        idx1, idx2 = np.concatenate(idx1), np.concatenate(idx2)
+        # Restore itertools.combinations order over the original group
+        keep = np.lexsort((idx2, idx1))
+        idx1, idx2 = idx1[keep], idx2[keep]
+        names_arr = np.array(names, dtype=object)
+        col_folder.extend([folder] * len(keep))
+        col_fn1.append(names_arr[idx1])
+        col_fn2.append(names_arr[idx2])
+        col_size.extend([size_MB] * len(keep))
+        col_tsr.append(np.concatenate(tsrs)[keep])
+        col_lev.append(np.concatenate(levs)[keep])
+    columns = ['top_level_folder', 'filename1', 'filename2', 'file_size_MB', 'token_sort_ratio', 'normalized_levenshtein', 'confidence']
+    if not col_fn1:
+        return pd.DataFrame(columns=columns)
+    tsr = np.concatenate(col_tsr)
+    norm_lev = np.concatenate(col_lev)
+    # Confidence assignment: every returned pair passed both thresholds, so it is at least "possible"
+    confidence = np.where((tsr >= 90) & (norm_lev >= 0.85), "high", "possible").astype(object)
+    return pd.DataFrame({
+        'top_level_folder': col_folder,
+        'filename1': np.concatenate(col_fn1),
+        'filename2': np.concatenate(col_fn2),
+        'file_size_MB': col_size,
+        'token_sort_ratio': tsr,
+        'normalized_levenshtein': norm_lev,
+        'confidence': confidence,
+    }, columns=columns)
 
-import json
 
 def _load_catalog_folder(profile="default"):
     """
@@ -161,39 +255,19 @@ def find_and_save_duplicates(profile="default"):
     db_path = os.path.join(catalog_folder, "library.sqlite")
     exclusions = _load_exclusions()
     records = get_file_records(db_path, exclusions=exclusions)
-    # --- SHA256 exact duplicate detection ---
-    from collections import defaultdict
-    hash_map = defaultdict(list)
-    for rec in records:
-        sha = rec.get('sha256')
-        if sha and sha.strip():
-            hash_map[sha].append(rec)
-    exact_pairs = []
-    for sha, group in hash_map.items():
-        if len(group) < 2:
-            continue
-        # All unique pairs for this hash
-        for i in range(len(group)):
-            for j in range(i+1, len(group)):
-                r1, r2 = group[i], group[j]
-                exact_pairs.append({
-                    'top_level_folder': r1['top_level_folder'],
-                    'filename1': r1['filename'],
-                    'filename2': r2['filename'],
-                    'file_size_MB': r1['file_size_MB'],
-                    'confidence': 'exact'
-                })
+    # --- SHA256 exact duplicate detection (grouped in SQLite) ---
+    exact_pairs = find_exact_duplicates(db_path, exclusions=exclusions)
     # --- Fuzzy/size duplicate detection as before ---
-    pairs = find_duplicates(records)
-    df_fuzzy = compute_similarity(pairs)
-    # Filter: only keep rows with token_sort_ratio >= 80 AND normalized_levenshtein >= 0.7
-    df_fuzzy = df_fuzzy[(df_fuzzy['token_sort_ratio'] >= 80) & (df_fuzzy['normalized_levenshtein'] >= 0.7)]
+    groups = find_duplicates(records)
+    # compute_similarity only returns pairs with token_sort_ratio >= 80 AND normalized_levenshtein >= 0.7
+    df_fuzzy = compute_similarity(groups)
     # Only output the requested columns
     output_cols = ['top_level_folder', 'filename1', 'filename2', 'file_size_MB', 'confidence']
     df_fuzzy = df_fuzzy[output_cols]
     # Remove fuzzy pairs that are already exact pairs
-    exact_set = set((row['top_level_folder'], row['filename1'], row['filename2'], row['file_size_MB']) for row in exact_pairs)
-    df_fuzzy = df_fuzzy[~df_fuzzy.apply(lambda row: (row['top_level_folder'], row['filename1'], row['filename2'], row['file_size_MB']) in exact_set, axis=1)]
+    pair_cols = ['top_level_folder', 'filename1', 'filename2', 'file_size_MB']
+    exact_idx = pd.MultiIndex.from_arrays([exact_pairs[c] for c in pair_cols], names=pair_cols)
+    df_fuzzy = df_fuzzy.loc[~pd.MultiIndex.from_frame(df_fuzzy[pair_cols]).isin(exact_idx)]
     # Combine exact and fuzzy
     df_exact = pd.DataFrame(exact_pairs, columns=output_cols)
     df_out = pd.concat([df_exact, df_fuzzy], ignore_index=True)
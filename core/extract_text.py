@@ -7,36 +7,38 @@ Non-Std Deps: PyMuPDF (fitz)
 Abstract Spec: Receives PDF path, extracts text, writes to .txt in extract folder, returns status.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import fitz  # PyMuPDF
-from core.log_utils import log_event
+from core.log_utils import log_event, init_log_worker, get_log_path
 
 
-def extract_text_from_pdf(pdf_path: Path, verbose: bool = False) -> str:
+def extract_text_to_file(pdf_path: Path, output_path: Path, verbose: bool = False) -> int:
     """
-    Purpose: Extract all text from a PDF file.
-    Inputs: pdf_path (Path) - Path to the PDF file.
-    Outputs: text (str) - The extracted text content.
-    Role: Converts the PDF's content into plain text for saving.
+    Purpose: Stream a PDF's text to a .txt file one page at a time.
+    Inputs: pdf_path (Path) - Path to the PDF file; output_path (Path) - Where to save the file.
+    Outputs: chars (int) - Number of characters written.
+    Role: Only one page's text is held in memory at a time.
+          Text goes to a temporary file that replaces output_path only once the whole document is written,
+          so a failed extraction never leaves a partial .txt that later scans would treat as done.
     """
     log_event(f"[INFO] Extracting text from PDF: {pdf_path}", verbose)
-    doc = fitz.open(str(pdf_path))
-    text = "".join(page.get_text() for page in doc)
-    log_event(f"[INFO] Extracted text length: {len(text)} chars from {pdf_path}", verbose)
-    return text
-
-
-def save_text_to_txt(text: str, output_path: Path, verbose: bool = False) -> None:
-    """
-    Purpose: Save extracted text to a text (.txt) file at the specified path.
-    Inputs: text (str) - The text to save; output_path (Path) - Where to save the file.
-    Outputs: None
-    Role: Persists the extracted text for user access and further use.
-    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as txt_file:
-        txt_file.write(text)
-    log_event(f"[INFO] Saved extracted text to: {output_path}", verbose)
+    tmp_path = output_path.with_name(output_path.name + ".partial")
+    chars = 0
+    try:
+        with fitz.open(str(pdf_path)) as doc, open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as txt_file:
+            for page in doc:
+                page_text = page.get_text()
+                txt_file.write(page_text)
+                chars += len(page_text)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    log_event(f"[INFO] Saved {chars} chars of extracted text to: {output_path}", verbose)
+    return chars
 
 
 def extract_and_save(pdf_path: Path, txt_path: Path, verbose: bool = False) -> bool:
@@ -48,9 +50,43 @@ def extract_and_save(pdf_path: Path, txt_path: Path, verbose: bool = False) -> b
     """
     try:
         log_event(f"[INFO] extract_and_save: {pdf_path} → {txt_path}", verbose)
-        text = extract_text_from_pdf(pdf_path, verbose=verbose)
-        save_text_to_txt(text, txt_path, verbose=verbose)
+        extract_text_to_file(Path(pdf_path), Path(txt_path), verbose=verbose)
         return True
     except Exception as e:
         log_event(f"[ERROR] Failed to extract '{pdf_path}': {e}", verbose)
         return False
+
+
+# PDFs handed to a worker per round-trip in extract_and_save_many
+EXTRACT_CHUNKSIZE = 4
+
+
+def extract_and_save_many(pairs: list[tuple[Path, Path]], workers: int = None, verbose: bool = False) -> list[bool]:
+    """
+    Purpose: Extract many PDFs to txt files in parallel, one worker process per core.
+    Inputs: pairs (list of (pdf_path, txt_path)), workers (int or None) - defaults to os.cpu_count(), verbose (bool)
+    Outputs: List of success flags, in the order of pairs.
+    Role: Batch entry point for PDF text extraction. Each PDF is independent and CPU-bound, so files are spread
+          across processes (which also keeps PyMuPDF's C-side memory from building up in the caller).
+          A single PDF is extracted in-process with extract_and_save. Workers are pointed at the caller's
+          log file and only ever append to it (see init_log_worker).
+    """
+    if len(pairs) <= 1 or workers == 1:
+        return [extract_and_save(pdf_path, txt_path, verbose=verbose) for pdf_path, txt_path in pairs]
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=init_log_worker, initargs=(get_log_path(),)) as executor:
+            for success in executor.map(
+                extract_and_save,
+                [pdf_path for pdf_path, _ in pairs],
+                [txt_path for _, txt_path in pairs],
+                [verbose] * len(pairs),
+                chunksize=EXTRACT_CHUNKSIZE,
+            ):
+                results.append(success)
+    except Exception as e:
+        # extract_and_save never raises, so this is the pool itself failing (e.g. a worker crashed)
+        log_event(f"[ERROR] Parallel PDF extraction stopped after {len(results)} of {len(pairs)} files: {e}", verbose)
+        results.extend([False] * (len(pairs) - len(results)))
+    return results
@@ -7,6 +7,10 @@ Non-Std Deps: None
 Abstract Spec: Contains reusable file utilities for use across modules, including config and prompt loading with error handling.
 """
 
+import os
+import json
+from pathlib import Path
+
 def get_file_extension(filename: str) -> str:
     """
     Purpose: Robustly extract the true file extension (after the last period) from a filename.
@@ -14,7 +18,6 @@ def get_file_extension(filename: str) -> str:
     Outputs: extension (str) - The file extension, without the leading dot, or '' if none.
     Role: Ensures only the true extension is used, regardless of periods in the base name.
     """
-    import os
     ext = os.path.splitext(filename)[1]
     return ext[1:] if ext.startswith('.') else ext
 
@@ -27,8 +30,6 @@ def load_config(config_path, required_keys=None):
     Outputs: config (dict) - Loaded configuration dictionary.
     Role: Centralizes config loading and validation with error handling.
     """
-    import json
-    from pathlib import Path
     config_path = Path(config_path)
     if not config_path.exists():
         raise FileNotFoundError(f"[ERROR] Config file not found: {config_path}")
@@ -48,7 +49,6 @@ def load_prompt(prompt_path):
     Outputs: prompt (str) - Prompt file contents as string.
     Role: Centralizes prompt file loading with error handling.
     """
-    from pathlib import Path
     prompt_path = Path(prompt_path)
     if not prompt_path.exists():
         raise FileNotFoundError(f"[ERROR] Prompt file not found: {prompt_path}")
@@ -7,25 +7,85 @@ Abstract Spec: See dev/project-brief.md (T11)
 
 Behavior: When --verbose is set, logs.txt is overwritten (not appended) at the start of each run. Only the latest operation is kept.
 """
-from typing import Optional
+from typing import Optional, TextIO
 from pathlib import Path
+import atexit
 
 _log_file_initialized = {}
+_is_log_owner = True  # False in pool workers (see init_log_worker), which must never truncate a log file
 _default_log_path = None
+_log_handles = {}  # requested log path (or None for the default) -> open handle
+_open_log_files = {}  # resolved log file -> open handle, shared by every spelling of the same path
 
-def set_log_path(log_path: str):
+def set_log_path(log_path: Optional[str]):
     """
     Purpose: Set the default log file path for all log_event calls.
-    Inputs: log_path (str)
+    Inputs: log_path (Optional[str]) - None restores core/logs.txt
     Outputs: None
     Role: Allows dynamic control of log location (e.g., catalog_folder/logs.txt).
     """
     global _default_log_path
     _default_log_path = log_path
 
+def init_log_worker(log_path: Optional[str]):
+    """
+    Purpose: Point a worker process at the caller's log file and mark it as not owning the run.
+    Inputs: log_path (Optional[str]) - the caller's get_log_path()
+    Outputs: None
+    Role: Process-pool initializer. Spawned workers do not inherit set_log_path, and no worker
+          (forked or spawned) may truncate a log file the caller is writing to; workers only append.
+    """
+    global _is_log_owner
+    set_log_path(log_path)
+    _is_log_owner = False
+
+def get_log_path() -> Optional[str]:
+    """
+    Purpose: Return the default log file path set by set_log_path.
+    Inputs: None
+    Outputs: log_path (Optional[str]) - None means core/logs.txt
+    Role: Lets callers hand the current log location to worker processes.
+    """
+    return _default_log_path
+
+def _get_log_handle(log_path: Optional[str]) -> TextIO:
+    """
+    Purpose: Return the open handle for a log file, opening it (and creating its folder) on first use.
+    Inputs: log_path (Optional[str]) - as passed to log_event
+    Outputs: Line-buffered text handle
+    Role: Lets log_event keep one handle per log file instead of opening and closing it per message.
+          Only the process that owns the run truncates the file; it then reopens it, like every worker
+          process (forked or spawned), in append mode so concurrent writers never overwrite each other.
+          Line buffering flushes every message, so nothing is lost on a crash or duplicated in forked workers.
+    """
+    target = log_path or _default_log_path
+    fh = _log_handles.get(target)
+    if fh is not None and not fh.closed:
+        return fh
+    log_file = Path(target) if target else Path(__file__).parent / "logs.txt"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    key = str(log_file.resolve())
+    fh = _open_log_files.get(key)
+    if fh is None or fh.closed:
+        if not _log_file_initialized.get(key, False):
+            if _is_log_owner:
+                log_file.open("w", encoding="utf-8").close()
+            _log_file_initialized[key] = True
+        fh = log_file.open("a", encoding="utf-8", buffering=1)
+        _open_log_files[key] = fh
+    _log_handles[target] = fh
+    return fh
+
+@atexit.register
+def _close_log_handles() -> None:
+    for fh in _open_log_files.values():
+        fh.close()
+    _open_log_files.clear()
+    _log_handles.clear()
+
 def log_event(msg: str, verbose: bool, log_path: Optional[str] = None) -> None:
     """
-    Purpose: Log a process event message to a file if verbose is True. On first call per run, overwrites logs.txt; subsequent calls append.
+    Purpose: Log a process event message to a file if verbose is True. On first call per run, overwrites logs.txt; subsequent calls (and worker processes) append.
     Inputs:
         msg: Message to log (str)
         verbose: Whether to log (bool)
@@ -34,17 +94,8 @@ def log_event(msg: str, verbose: bool, log_path: Optional[str] = None) -> None:
         None
     Role: Called by catalog workflow to record process steps for audit/debugging.
     Behavior: When --verbose is set, logs.txt is overwritten (not appended) at the start of each run. Only the latest operation is kept.
+              The file stays open for the rest of the run (see _get_log_handle).
     """
     if not verbose:
         return
-    global _default_log_path
-    log_file = Path(log_path) if log_path else Path(_default_log_path) if _default_log_path else Path(__file__).parent / "logs.txt"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    global _log_file_initialized
-    key = str(log_file.resolve())
-    mode = "a"
-    if not _log_file_initialized.get(key, False):
-        mode = "w"
-        _log_file_initialized[key] = True
-    with log_file.open(mode, encoding="utf-8") as f:
-        f.write(msg.rstrip("\n") + "\n")
+    _get_log_handle(log_path).write(msg.rstrip("\n") + "\n")
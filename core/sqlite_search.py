@@ -6,14 +6,55 @@ Last-Updated: 2025-06-06
 Non-Std Deps: sqlite3
 Abstract Spec: Connects to SQLite database, performs search queries on filename field, 
               and returns results as a list of dictionaries with file information.
+              Substring matches use the catalog_fts trigram index when present and every term
+              has 3+ characters, else a LIKE scan.
 """
 
 import sqlite3
+import atexit
 from pathlib import Path
 import os
 from core.log_utils import log_event
 
 
+# Per-connection read tuning: memory temp store, 256 MB mmap, 64 MB page cache.
+# Nothing here persists in the database file, so searching never changes the catalog's journal mode.
+CONNECTION_PRAGMAS = [
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+]
+
+_conn_cache: dict[str, sqlite3.Connection] = {}
+
+
+def get_connection(db_path) -> sqlite3.Connection:
+    """
+    Purpose: Return the shared, tuned connection for a SQLite database, opening it on first use
+    Inputs:
+        db_path (str | Path): Path to the SQLite database
+    Outputs:
+        conn (sqlite3.Connection): Cached connection with CONNECTION_PRAGMAS applied
+    Role: Lets repeated reads in one process reuse one connection and its page cache. Callers must not close it;
+          all cached connections are closed at interpreter exit.
+    """
+    key = os.path.abspath(db_path)
+    conn = _conn_cache.get(key)
+    if conn is None:
+        conn = sqlite3.connect(key)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _conn_cache[key] = conn
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    for conn in _conn_cache.values():
+        conn.close()
+    _conn_cache.clear()
+
+
 def search_filenames(
     catalog_folder: Path, 
     search_query: str | list, 
@@ -41,37 +82,36 @@ def search_filenames(
         return []
     
     try:
-        # Connect to the SQLite database
-        conn = sqlite3.connect(str(db_path))
+        # Shared connection to the SQLite database
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         
+        # Use the trigram filename index when the catalog has one (see adapters/save_to_sqlite.ensure_filename_fts)
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='catalog_fts'")
+        use_fts = cursor.fetchone() is not None
+        
         # Handle single term or multiple terms
-        if isinstance(search_query, list):
+        terms = search_query if isinstance(search_query, list) else [search_query]
+        parameters = [f"%{term}%" for term in terms]
+        if use_fts and all(len(term) >= 3 for term in terms):
+            # Same LIKE semantics, answered from the index; one UNION branch per term keeps each lookup indexed.
+            # Shorter terms get no trigram speedup and can miss non-ASCII matches, so they take the LIKE scan below.
+            matches = " UNION ".join("SELECT rowid FROM catalog_fts WHERE filename LIKE ?" for _ in terms)
+            where_clause = f"rowid IN ({matches})"
+        else:
             # Multiple search terms - build query with OR conditions
-            placeholders = []
-            parameters = []
-            for term in search_query:
-                placeholders.append("filename LIKE ?")
-                parameters.append(f"%{term}%")
-            where_clause = " OR ".join(placeholders)
-            query = f"""
-                SELECT relative_path, filename, extension, last_modified, file_size_in_MB
-                FROM catalog
-                WHERE {where_clause}
-                ORDER BY relative_path, filename
-            """
+            where_clause = " OR ".join("filename LIKE ?" for _ in terms)
+        query = f"""
+            SELECT relative_path, filename, extension, last_modified, file_size_in_MB
+            FROM catalog
+            WHERE {where_clause}
+            ORDER BY relative_path, filename
+        """
+        if isinstance(search_query, list):
             log_event(f"[STEP] Executing SQL query with multiple patterns: {parameters}", verbose)
-            cursor.execute(query, parameters)
         else:
-            search_pattern = f"%{search_query}%"
-            query = """
-                SELECT relative_path, filename, extension, last_modified, file_size_in_MB
-                FROM catalog
-                WHERE filename LIKE ?
-                ORDER BY relative_path, filename
-            """
-            log_event(f"[STEP] Executing SQL query with pattern: '{search_pattern}'", verbose)
-            cursor.execute(query, (search_pattern,))
+            log_event(f"[STEP] Executing SQL query with pattern: '{parameters[0]}'", verbose)
+        cursor.execute(query, parameters)
         
         # Fetch all matching rows
         rows = cursor.fetchall()
@@ -87,9 +127,6 @@ def search_filenames(
                 'file_size_in_MB': row[4]
             })
         
-        # Close the connection
-        conn.close()
-        
         log_event(f"[END] Search complete. Found {len(results)} matching files.", verbose)
         return results
         
@@ -3,38 +3,175 @@ token_counter.py | TXT Token Counting Utility
 Purpose: Estimate token count for a .txt file using model-agnostic heuristics
 Author: ChAI-Engine
 Last-Updated: 2025-05-24
-Non-Std Deps: None
+Non-Std Deps: numpy (optional; speeds up word counting on large chunks)
 Abstract Spec: Given a .txt file path, return the estimated number of tokens using two heuristics and their average.
 """
 
+import os
+import io
+import codecs
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 from core.log_utils import log_event
 
-def count_tokens(txt_file_path: str, verbose: bool = False) -> int:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bytes read per step when streaming a TXT file; memory use is bounded by this, not the file size
+STREAM_CHUNK_SIZE = 1 << 20
+
+def _estimate_tokens(word_count: int, char_count: int) -> int:
+    """
+    Purpose: Combine the word and character heuristics into one token estimate.
+    Inputs: word_count (int), char_count (int)
+    Outputs: int: Estimated token count (see count_tokens for the heuristics)
+    Role: Single definition of the estimate used by every counting path.
+    """
+    est1_token_count = word_count * 1.25
+    est2_token_count = (char_count / 4) * 0.75
+    return int((est1_token_count + est2_token_count) / 2)
+
+# ASCII bytes mapped to b' ' (whitespace as str.split() sees it) or b'x' (anything else)
+_ASCII_WORD_TABLE = bytes(32 if chr(c).isspace() else 120 for c in range(128)) + b'x' * 128
+# Below this many bytes bytes.count beats the fixed cost of a numpy pass
+NUMPY_WORD_COUNT_MIN_BYTES = 1024
+
+def _count_words(text: str) -> int:
+    """
+    Purpose: Count whitespace-separated words exactly as len(text.split()) would.
+    Inputs: text (str)
+    Outputs: int: Number of words
+    Role: ASCII text (the common case for transcripts) is counted as word starts on a translated byte string,
+          so no list of word substrings is built; large chunks compare the marks with numpy in one vectorised pass.
+          Other text falls back to str.split().
+    """
+    if not text.isascii():
+        return len(text.split())
+    marks = text.encode('ascii').translate(_ASCII_WORD_TABLE)
+    if np is not None and len(marks) >= NUMPY_WORD_COUNT_MIN_BYTES:
+        # b' ' < b'x', so a word starts wherever a mark is greater than the one before it
+        arr = np.frombuffer(marks, dtype=np.uint8)
+        return int(np.count_nonzero(arr[1:] > arr[:-1])) + (marks[:1] == b'x')
+    return marks.count(b' x') + (marks[:1] == b'x')
+
+def count_tokens_from_chunks(text_chunks: Iterable[str]) -> int:
+    """
+    Purpose: Apply the token heuristics to text arriving in pieces.
+    Inputs:
+        text_chunks (Iterable[str]): Consecutive pieces of decoded text
+    Outputs:
+        int: Estimated token count, identical to applying the heuristics to the joined text
+    Role: Streaming core of count_tokens and count_tokens_and_sha256. A word split across two chunks is
+          counted once; whitespace is what str.split() treats as whitespace (str.isspace).
+    """
+    char_count = 0
+    word_count = 0
+    prev_ends_in_word = False
+    for chunk in text_chunks:
+        if not chunk:
+            continue
+        char_count += len(chunk)
+        word_count += _count_words(chunk)
+        if prev_ends_in_word and not chunk[0].isspace():
+            word_count -= 1
+        prev_ends_in_word = not chunk[-1].isspace()
+    return _estimate_tokens(word_count, char_count)
+
+def _read_text_chunks(f, h=None):
+    """
+    Purpose: Yield decoded text from an unbuffered binary file, STREAM_CHUNK_SIZE bytes per read.
+    Inputs: f (raw binary file), h (hashlib object or None) - updated with every byte chunk when given
+    Outputs: Generator of str chunks, UTF-8 decoded (strict) with newlines translated as text-mode reads do
+    Role: Shared reader for count_tokens and count_tokens_and_sha256. Reading the raw file directly skips the
+          BufferedReader/TextIOWrapper layers; small files take a single read() before EOF.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+        if h is not None:
+            h.update(chunk)
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+def count_tokens(txt_file_path: str | os.PathLike, verbose: bool = False) -> int:
     """
     Purpose: Estimate the number of tokens in a TXT file using model-agnostic heuristics.
     Inputs:
-        txt_file_path (str): Path to the .txt file
+        txt_file_path (str | os.PathLike): Path to the .txt file, used as given (no str() conversion)
     Outputs:
         int: Estimated token count
-    Role: Utility function for cataloguing and workflow modules.
+    Role: Utility function for cataloguing and workflow modules. The file is streamed in STREAM_CHUNK_SIZE pieces,
+          so neither the whole text nor its word list is ever held in memory.
     Heuristics:
         - est1: len(text.split()) * 1.25 (word count, ~30% underestimate)
         - est2: (len(text) / 4) * 0.75 (character count, ~25% overestimate)
         - Average of both as final token_count
     """
-    log_event(f"[INFO] Counting tokens in {txt_file_path}", verbose)
-    with open(txt_file_path, "r", encoding="utf-8") as f:
-        text = f.read()
-    est1_token_count = len(text.split()) * 1.25
-    est2_token_count = (len(text) / 4) * 0.75
-    token_count = int((est1_token_count + est2_token_count) / 2)
-    log_event(f"[INFO] Token count for {txt_file_path}: {token_count}", verbose)
+    if verbose:
+        log_event(f"[INFO] Counting tokens in {txt_file_path}", True)
+    with open(txt_file_path, "rb", buffering=0) as f:
+        token_count = count_tokens_from_chunks(_read_text_chunks(f))
+    if verbose:
+        log_event(f"[INFO] Token count for {txt_file_path}: {token_count}", True)
     return token_count
 
+def count_tokens_and_sha256(txt_file_path: str | os.PathLike, verbose: bool = False) -> tuple:
+    """
+    Purpose: Estimate tokens and compute the SHA-256 of a TXT file from a single read.
+    Inputs:
+        txt_file_path (str | os.PathLike): Path to the .txt file
+    Outputs:
+        tuple: (token_count (int), sha256 (str))
+    Role: Used when the catalog needs both values for the same file, so the file is read once instead of twice.
+          Each byte chunk is hashed before decoding, so counts match count_tokens exactly.
+    """
+    if verbose:
+        log_event(f"[INFO] Counting tokens and hashing {txt_file_path}", True)
+    h = hashlib.sha256()
+    with open(txt_file_path, "rb", buffering=0) as f:
+        token_count = count_tokens_from_chunks(_read_text_chunks(f, h))
+    if verbose:
+        log_event(f"[INFO] Token count for {txt_file_path}: {token_count}", True)
+    return token_count, h.hexdigest()
+
+def count_tokens_batch(txt_file_paths: list, verbose: bool = False, with_sha256: bool = False, max_workers: int = 1) -> list:
+    """
+    Purpose: Estimate token counts for many TXT files in one call.
+    Inputs:
+        txt_file_paths (list): Paths to .txt files (str or os.PathLike)
+        with_sha256 (bool): Also hash each file from the same read (see count_tokens_and_sha256)
+        max_workers (int): Threads used to read files concurrently; 1 counts them one after another
+    Outputs:
+        list: Estimated token count per path, in input order, or (token_count, sha256) tuples when with_sha256.
+              None where the file could not be read.
+    Role: Lets callers hand a whole group of files to one worker, avoiding per-file dispatch overhead.
+          With max_workers > 1, file reads (and hashing, which releases the GIL) overlap across threads,
+          which mostly pays off on slow or network storage.
+    """
+    count_fn = count_tokens_and_sha256 if with_sha256 else count_tokens
+
+    def _count_one(txt_file_path):
+        try:
+            return count_fn(txt_file_path, verbose=verbose)
+        except Exception as e:
+            log_event(f"[ERROR] Token counting failed for {txt_file_path}: {e}", verbose)
+            return None
+
+    if max_workers > 1 and len(txt_file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_count_one, txt_file_paths))
+    return [_count_one(txt_file_path) for txt_file_path in txt_file_paths]
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) < 2:
-        print("Usage: python token_counter.py <txt_file_path>")
+        print("Usage: python token_counter.py <txt_file_path> [<txt_file_path> ...]")
         sys.exit(1)
-    txt_file = sys.argv[1]
-    print(count_tokens(txt_file))
+    if len(sys.argv) == 2:
+        print(count_tokens(sys.argv[1]))
+    else:
+        txt_files = sys.argv[1:]
+        for txt_file, token_count in zip(txt_files, count_tokens_batch(txt_files, max_workers=os.cpu_count() or 1)):
+            print(f"{txt_file}: {token_count}")
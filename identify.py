@@ -11,23 +11,17 @@ Abstract Spec: Provides a dedicated entry point for the PDF identification workf
 import sys
 import argparse
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Import the necessary modules from the existing codebase
-from agents.PDF_renamer import process_pdf_directory
-from adapters.llm_provider import get_llm_provider
-from core.file_utils import load_prompt
+# ports.profile_loader loads .env on first use
 from ports.profile_loader import add_profile_arg, load_profile_config
 
-# Load environment variables
-load_dotenv()
-
 def main():
     """
     Purpose: CLI entry point for PDF identification workflow.
     Inputs:
         --profile: Library profile to use (from folder_paths.json)
         --verbose: Enable verbose logging
+        --workers: PDFs to identify concurrently
     Outputs: None
     Role: Provides a simple entry point to the PDF identification workflow.
     """
@@ -35,8 +29,14 @@ def main():
     parser = argparse.ArgumentParser(description="PDF Identification Tool")
     add_profile_arg(parser)  # Add the --profile argument
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--workers", type=int, default=None, help="PDFs to identify concurrently (default: 4; 1 = one at a time)")
     args = parser.parse_args()
 
+    # Workflow modules (PyPDF2, the LLM client) are only imported once the arguments are valid
+    from agents.PDF_renamer import process_pdf_directory, IDENTIFY_MAX_CONCURRENCY
+    from adapters.llm_provider import get_llm_provider
+    from core.file_utils import load_prompt
+
     try:
         # Load profile-specific config
         profile_config = load_profile_config(args=args)
@@ -52,7 +52,8 @@ def main():
         llm = get_llm_provider(workflow="identify")
         
         # Process the PDFs in the buffer folder
-        process_pdf_directory(Path(buffer_folder), llm, prompt, n_pages=5, verbose=args.verbose)
+        workers = args.workers if args.workers is not None else IDENTIFY_MAX_CONCURRENCY
+        process_pdf_directory(Path(buffer_folder), llm, prompt, n_pages=5, verbose=args.verbose, max_concurrency=workers)
         
     except Exception as e:
         print(str(e))
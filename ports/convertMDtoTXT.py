@@ -7,6 +7,9 @@ Non-Std Deps: None
 Abstract Spec: Accept a single MD file path, extract the filename, and save a copy as .txt in the same directory.
 """
 
+import os
+import sys
+import shutil
 from core.log_utils import log_event
 
 def convert_md_to_txt(md_path: str, verbose: bool = False) -> str:
@@ -18,9 +21,8 @@ def convert_md_to_txt(md_path: str, verbose: bool = False) -> str:
         str: Path to the output TXT file.
     Role: Core adapter for Markdown-to-TXT conversion.
     """
-    import os
-    import shutil
-    log_event(f"[INFO] Starting MD→TXT conversion: {md_path}", verbose)
+    if verbose:
+        log_event(f"[INFO] Starting MD→TXT conversion: {md_path}", True)
     if not md_path.lower().endswith('.md'):
         log_event(f"[ERROR] Input file must have .md extension: {md_path}", verbose)
         raise ValueError('Input file must have .md extension')
@@ -29,7 +31,8 @@ def convert_md_to_txt(md_path: str, verbose: bool = False) -> str:
         raise FileNotFoundError(f'File not found: {md_path}')
     txt_path = os.path.splitext(md_path)[0] + '.txt'
     shutil.copyfile(md_path, txt_path)
-    log_event(f"[INFO] Created TXT: {txt_path}", verbose)
+    if verbose:
+        log_event(f"[INFO] Created TXT: {txt_path}", True)
     return txt_path
 
 def main(verbose: bool = False):
@@ -39,7 +42,6 @@ def main(verbose: bool = False):
     Outputs: Prints the path to the .txt file created
     Role: Entry point for manual or scripted invocation.
     """
-    import sys
     if len(sys.argv) != 2:
         log_event('Usage: python ports/convertMDtoTXT.py <path-to-md-file>', verbose)
         print('Usage: python ports/convertMDtoTXT.py <path-to-md-file>')
@@ -12,11 +12,18 @@ import re
 import os
 from core.log_utils import log_event
 
+# Compiled once at import. A styled line has a <c> or <c.class> tag followed somewhere later by </c>.
+OPEN_STYLE_TAG = re.compile(r"<c(?:\.[^>]*)?>")
+CLOSE_STYLE_TAG = "</c>"
+REMOVE_TAGS = re.compile(r"<[^>]+>")
+
 def extract_styled_lines(vtt_file_path: str) -> str:
     """
     Extract only lines containing styling tags from a VTT subtitle file, strip all tags,
     remove duplicates, and return plain text.
     
+    The file is read line by line, so only the kept lines are held in memory.
+    
     Args:
         vtt_file_path (str): Path to the VTT file to convert
         
@@ -24,33 +31,31 @@ def extract_styled_lines(vtt_file_path: str) -> str:
         str: Subtitle text in plain text format, only from styled lines with tags removed
     """
     path = Path(vtt_file_path)
-    text = path.read_text(encoding='utf-8')
-    lines = text.splitlines()
     txt_lines = []
     seen = set()
     
-    # Regex patterns for finding styled lines and removing tags
-    styling_tag_pattern = re.compile(r"<c(?:\.[^>]*)?>.*?</c>")
-    remove_tags_pattern = re.compile(r"<[^>]+>")
-    
-    for raw_line in lines:
-        # Only process lines with styling tags
-        if not styling_tag_pattern.search(raw_line):
-            continue
-            
-        # Remove all tags and strip whitespace
-        clean = remove_tags_pattern.sub('', raw_line).strip()
-        
-        # Skip empty lines
-        if not clean:
-            continue
-            
-        # Skip duplicates
-        if clean in seen:
-            continue
+    with path.open('r', encoding='utf-8', buffering=1 << 20) as f:
+        for raw_line in f:
+            # Only process lines with styling tags; the substring test skips most lines without touching the regex
+            if CLOSE_STYLE_TAG not in raw_line:
+                continue
+            open_tag = OPEN_STYLE_TAG.search(raw_line)
+            if not open_tag or raw_line.find(CLOSE_STYLE_TAG, open_tag.end()) == -1:
+                continue
+                
+            # Remove all tags and strip whitespace
+            clean = REMOVE_TAGS.sub('', raw_line).strip()
             
-        seen.add(clean)
-        txt_lines.append(clean)
+            # Skip empty lines
+            if not clean:
+                continue
+                
+            # Skip duplicates
+            if clean in seen:
+                continue
+                
+            seen.add(clean)
+            txt_lines.append(clean)
         
     return "\n\n".join(txt_lines)
 
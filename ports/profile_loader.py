@@ -3,19 +3,59 @@ ports/profile_loader.py | Library Profile Loader
 Purpose: Load library profile settings from folder_paths.json based on profile name
 Author: ChAI-Engine (chaiji)
 Last-Updated: 2025-06-06
-Non-Std Deps: None
+Non-Std Deps: python-dotenv
 Abstract Spec: Loads profile-specific settings from folder_paths.json, with fallback to DEFAULT_LIBRARY_PROFILE in .env
 """
 
 import os
 import json
 import argparse
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# .env is loaded on first use (see ensure_env_loaded), not at import, so --help paths skip dotenv
+_env_loaded = False
+
+
+CONFIG_PATH = Path(__file__).parent.parent / "user_inputs" / "folder_paths.json"
+
+
+def ensure_env_loaded() -> None:
+    """
+    Purpose: Load environment variables from the .env file, once per process.
+    Inputs: None
+    Outputs: None (updates os.environ; existing variables are not overridden)
+    Role: Single .env load shared by profile selection and the LLM provider, instead of one per importing module.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _env_loaded = True
+
+
+@functools.lru_cache(maxsize=4)
+def _load_raw_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Purpose: Parse folder_paths.json once per (path, mtime) within this process.
+    Inputs: config_path (str), mtime_ns (int) - part of the cache key only, so an edited file is re-read
+    Outputs: config (dict) - all profiles
+    Role: Shared by get_profile_name and load_profile_config. Parse errors are not cached. The file is read as
+          bytes in one call and json.loads decodes the UTF-8 itself, skipping the text-mode wrapper.
+    """
+    return json.loads(Path(config_path).read_bytes())
+
+
+def _read_profiles(config_path: Path) -> Dict[str, Any]:
+    """
+    Purpose: Return the parsed profiles for config_path, re-reading only when its mtime changes.
+    Inputs: config_path (Path)
+    Outputs: config (dict) - all profiles; raises FileNotFoundError / json.JSONDecodeError like json.load on the file
+    Role: One stat per call instead of an open and a parse.
+    """
+    return _load_raw_config(str(config_path), config_path.stat().st_mtime_ns)
 
 
 def get_profile_name(args: Optional[argparse.Namespace] = None) -> str:
@@ -25,6 +65,7 @@ def get_profile_name(args: Optional[argparse.Namespace] = None) -> str:
     Outputs: profile_name (str) - Name of the profile to use.
     Role: Centralizes profile selection logic with CLI args taking precedence over env vars.
     """
+    ensure_env_loaded()
     # Check CLI args first (highest priority)
     if args and hasattr(args, 'profile') and args.profile:
         return args.profile
@@ -36,13 +77,11 @@ def get_profile_name(args: Optional[argparse.Namespace] = None) -> str:
     
     # Default fallback if nothing else is specified
     # Use first profile in the config file instead of hardcoding "default"
-    config_path = Path(__file__).parent.parent / "user_inputs" / "folder_paths.json"
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-            if config and isinstance(config, dict) and len(config) > 0:
-                # Return the first profile name in the config
-                return list(config.keys())[0]
+        config = _read_profiles(CONFIG_PATH)
+        if config and isinstance(config, dict) and len(config) > 0:
+            # Return the first profile name in the config
+            return list(config.keys())[0]
     except Exception:
         pass
     
@@ -58,19 +97,20 @@ def load_profile_config(profile_name: str = None, args: Optional[argparse.Namesp
     Outputs: profile_config (dict) - Configuration dictionary for the specified profile.
     Role: Provides profile-specific configuration to other modules.
     """
+    ensure_env_loaded()
     # Determine profile name if not provided
     if profile_name is None:
         profile_name = get_profile_name(args)
     
     # Load the config file using absolute path
-    config_path = Path(__file__).parent.parent / "user_inputs" / "folder_paths.json"
+    config_path = CONFIG_PATH
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = _read_profiles(config_path)
         
-        # Extract the profile config
+        # Extract the profile config; profiles are shallow-copied so callers cannot alter the cached config
         if profile_name in config:
-            return config[profile_name]
+            profile = config[profile_name]
+            return dict(profile) if isinstance(profile, dict) else profile
         else:
             available_profiles = list(config.keys())
             if len(available_profiles) > 0:
@@ -9,9 +9,55 @@ Design Rationale: Provides a clean interface for tracking downloaded transcripts
 
 import os
 import csv
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 import re
+from core.log_utils import log_event
+
+# Parsed archives: str(archive_path) -> ((mtime_ns, size), filenames, video_ids); rebuilt when the file changes
+_ARCHIVE_CACHE: Dict[str, Tuple[Tuple[int, int], set, set]] = {}
+
+def _archive_stamp(archive_path: Path) -> Tuple[int, int]:
+    """
+    Purpose: Identify the current version of the archive file
+    Inputs:
+        archive_path (Path): Path to the archive CSV file
+    Outputs:
+        Tuple[int, int]: (mtime_ns, size) of the file; raises OSError if it cannot be stat'ed
+    Role: Cache key for _load_archive_sets
+    """
+    st = archive_path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+def _load_archive_sets(archive_path: Path, stamp: Tuple[int, int]) -> Tuple[set, set]:
+    """
+    Purpose: Return the archived filenames and video IDs, parsing the CSV only when it has changed
+    Inputs:
+        archive_path (Path): Path to the archive CSV file
+        stamp (Tuple[int, int]): Its current _archive_stamp, already taken by the caller
+    Outputs:
+        Tuple[set, set]: (filenames, video_ids) from every row with at least two columns, header skipped
+    Role: Lets is_transcript_in_archive answer with set lookups instead of scanning the CSV per video
+    """
+    key = str(archive_path)
+    cached = _ARCHIVE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    filenames = set()
+    video_ids = set()
+    with open(archive_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        # Skip header if exists
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 2:
+                filenames.add(row[0])
+                stored_video_id = extract_video_id(row[1])
+                if stored_video_id:
+                    video_ids.add(stored_video_id)
+    _ARCHIVE_CACHE[key] = (stamp, filenames, video_ids)
+    return filenames, video_ids
 
 def is_transcript_in_archive(video_url: str, filename: str, archive_path: Path, verbose: bool = False) -> bool:
     """
@@ -23,39 +69,26 @@ def is_transcript_in_archive(video_url: str, filename: str, archive_path: Path,
         verbose (bool): Whether to enable verbose logging
     Outputs:
         bool: True if transcript is in archive, False otherwise
-    Role: Core function for transcript archive checking
+    Role: Core function for transcript archive checking. The archive is parsed once per change of the file
+          (see _load_archive_sets), so each check is two set lookups.
     """
-    from core.log_utils import log_event
-    
-    if not archive_path.exists():
+    # One stat both tells whether the archive exists and keys the parsed-archive cache
+    try:
+        stamp = _archive_stamp(archive_path)
+    except OSError:
         if verbose:
             log_event(f"Archive file {archive_path} does not exist yet", verbose)
         return False
         
     try:
-        with open(archive_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            # Skip header if exists
-            try:
-                next(reader)
-            except StopIteration:
-                # Empty file, no header
-                return False
-                
-            # Extract video ID from URL for more reliable comparison
-            video_id = extract_video_id(video_url)
-            
-            for row in reader:
-                if len(row) >= 2:
-                    # Check if either filename or video ID matches
-                    stored_filename = row[0]
-                    stored_url = row[1]
-                    stored_video_id = extract_video_id(stored_url)
-                    
-                    if stored_filename == filename or (video_id and stored_video_id == video_id):
-                        if verbose:
-                            log_event(f"Transcript for {video_url} already in archive", verbose)
-                        return True
+        filenames, video_ids = _load_archive_sets(archive_path, stamp)
+        # Extract video ID from URL for more reliable comparison
+        video_id = extract_video_id(video_url)
+        # Check if either filename or video ID matches
+        if filename in filenames or (video_id and video_id in video_ids):
+            if verbose:
+                log_event(f"Transcript for {video_url} already in archive", verbose)
+            return True
                         
         if verbose:
             log_event(f"Transcript for {video_url} not found in archive", verbose)
@@ -79,14 +112,31 @@ def add_transcript_to_archive(video_url: str, filename: str, archive_path: Path,
         bool: True if successful, False otherwise
     Role: Core function for transcript archive management
     """
-    from core.log_utils import log_event
-    
+    return add_transcripts_to_archive([(video_url, filename)], archive_path, verbose)
+
+def add_transcripts_to_archive(entries: List[Tuple[str, str]], archive_path: Path, verbose: bool = False) -> bool:
+    """
+    Purpose: Add several transcripts to the archive with a single open of the CSV
+    Inputs:
+        entries (List[Tuple[str, str]]): (video_url, filename) pairs, in the order to append them
+        archive_path (Path): Path to the archive CSV file
+        verbose (bool): Whether to enable verbose logging
+    Outputs:
+        bool: True if all rows were written, False otherwise
+    Role: Shared writer behind add_transcript_to_archive and process_transcript_archive_batch
+    """
     try:
         # Create parent directory if it doesn't exist
         os.makedirs(archive_path.parent, exist_ok=True)
         
-        # Check if file exists to determine if we need to write headers
-        file_exists = archive_path.exists() and archive_path.stat().st_size > 0
+        # Check if file exists to determine if we need to write headers; one stat also checks the cache
+        try:
+            stamp = _archive_stamp(archive_path)
+        except OSError:
+            stamp = None
+        file_exists = stamp is not None and stamp[1] > 0
+        cached = _ARCHIVE_CACHE.get(str(archive_path))
+        cache_current = file_exists and cached is not None and cached[0] == stamp
         
         with open(archive_path, 'a+', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
@@ -96,14 +146,25 @@ def add_transcript_to_archive(video_url: str, filename: str, archive_path: Path,
                 writer.writerow(['Filename', 'URL', 'Date Added'])
                 
             # Get current date in ISO format
-            from datetime import datetime
             date_added = datetime.now().strftime('%Y-%m-%d')
             
             # Write transcript info
-            writer.writerow([filename, video_url, date_added])
+            writer.writerows([filename, video_url, date_added] for video_url, filename in entries)
             
+        # Keep the parsed archive in step with the rows just appended instead of re-reading it next time
+        if cache_current:
+            for video_url, filename in entries:
+                cached[1].add(filename)
+                video_id = extract_video_id(video_url)
+                if video_id:
+                    cached[2].add(video_id)
+            _ARCHIVE_CACHE[str(archive_path)] = (_archive_stamp(archive_path), cached[1], cached[2])
+        else:
+            _ARCHIVE_CACHE.pop(str(archive_path), None)
+
         if verbose:
-            log_event(f"Added transcript {filename} for {video_url} to archive", verbose)
+            for video_url, filename in entries:
+                log_event(f"Added transcript {filename} for {video_url} to archive", verbose)
         return True
         
     except Exception as e:
@@ -114,6 +175,13 @@ def add_transcript_to_archive(video_url: str, filename: str, archive_path: Path,
             log_event(error_msg, verbose)
         return False
 
+# Match common YouTube URL patterns (compiled once; extract_video_id runs for every archived row)
+VIDEO_ID_PATTERNS = (
+    re.compile(r'(?:v=|\/)([0-9A-Za-z_-]{11})(?:&|$|\?)'),  # Standard YouTube URLs
+    re.compile(r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})'),      # Short youtu.be URLs
+    re.compile(r'(?:embed\/)([0-9A-Za-z_-]{11})'),          # Embed URLs
+)
+
 def extract_video_id(video_url: str) -> Optional[str]:
     """
     Purpose: Extract YouTube video ID from URL
@@ -123,15 +191,8 @@ def extract_video_id(video_url: str) -> Optional[str]:
         Optional[str]: Video ID if found, None otherwise
     Role: Helper function for transcript archive management
     """
-    # Match common YouTube URL patterns
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11})(?:&|$|\?)',  # Standard YouTube URLs
-        r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})',      # Short youtu.be URLs
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',          # Embed URLs
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, video_url)
+    for pattern in VIDEO_ID_PATTERNS:
+        match = pattern.search(video_url)
         if match:
             return match.group(1)
             
@@ -147,8 +208,6 @@ def get_archive_path(catalog_folder: Path, verbose: bool = False) -> Path:
         Path: Path to the transcript archive file
     Role: Helper function for transcript archive management
     """
-    from core.log_utils import log_event
-    
     archive_path = catalog_folder / "latest-transcript-archive.csv"
     
     if verbose:
@@ -168,8 +227,6 @@ def process_transcript_archive(video_url: str, filename: str, catalog_folder: Pa
         bool: True if transcript should be downloaded, False if it's already in archive
     Role: Main entry point for transcript archive processing
     """
-    from core.log_utils import log_event
-    
     # Get archive path
     archive_path = get_archive_path(catalog_folder, verbose)
     
@@ -186,3 +243,43 @@ def process_transcript_archive(video_url: str, filename: str, catalog_folder: Pa
         log_event(f"Successfully added transcript for {video_url} to archive", verbose)
         
     return success
+
+def process_transcript_archive_batch(entries: List[Tuple[str, str]], catalog_folder: Path, verbose: bool = False) -> List[bool]:
+    """
+    Purpose: Process several transcripts (e.g. a playlist) for archiving, appending all new ones in one write
+    Inputs:
+        entries (List[Tuple[str, str]]): (video_url, filename) pairs
+        catalog_folder (Path): Path to the catalog folder
+        verbose (bool): Whether to enable verbose logging
+    Outputs:
+        List[bool]: Per entry, True if it was added (should be downloaded), False if already archived or the write failed
+    Role: Same decisions as calling process_transcript_archive per entry, including an entry repeating an
+          earlier one in the batch, but with one open of the archive CSV instead of one per video
+    """
+    archive_path = get_archive_path(catalog_folder, verbose)
+    results = []
+    to_add = []
+    batch_filenames = set()
+    batch_video_ids = set()
+    for video_url, filename in entries:
+        video_id = extract_video_id(video_url)
+        if (is_transcript_in_archive(video_url, filename, archive_path, verbose)
+                or filename in batch_filenames or (video_id and video_id in batch_video_ids)):
+            if verbose:
+                log_event(f"Transcript for {video_url} already in archive, skipping", verbose)
+            results.append(False)
+            continue
+        to_add.append((video_url, filename))
+        batch_filenames.add(filename)
+        if video_id:
+            batch_video_ids.add(video_id)
+        results.append(True)
+    
+    if to_add:
+        success = add_transcripts_to_archive(to_add, archive_path, verbose)
+        if not success:
+            return [False] * len(results)
+        if verbose:
+            for video_url, _ in to_add:
+                log_event(f"Successfully added transcript for {video_url} to archive", verbose)
+    return results
@@ -9,17 +9,16 @@ Abstract Spec: Provides direct access to book recommendation functionality witho
 """
 
 import sys
+import os
 import argparse
-from pathlib import Path
 
-# Ensure project root is in sys.path for absolute imports
-project_root = Path(__file__).resolve().parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# Ensure project root is in sys.path for absolute imports (abspath is string-only, no stat walk)
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-# Import necessary modules
+# Import necessary modules; the recommender itself (pandas, LLM client) is imported after argument parsing
 try:
-    from agents.book_recommender import main as recommend_main
     from ports.profile_loader import add_profile_arg
 except ModuleNotFoundError as e:
     print(f"\n[ImportError] Could not import required modules: {e}")
@@ -34,6 +33,12 @@ def main():
     add_profile_arg(parser)
     
     args = parser.parse_args()
+
+    try:
+        from agents.book_recommender import main as recommend_main
+    except ModuleNotFoundError as e:
+        print(f"\n[ImportError] Could not import required modules: {e}")
+        sys.exit(1)
     
     # Call the book recommender's main function with the parsed arguments
     recommend_main(args, args.query if hasattr(args, 'query') else None)
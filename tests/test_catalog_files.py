@@ -0,0 +1,52 @@
+"""
+tests/test_catalog_files.py | Catalog workflow regression tests
+Run from the project root: python -m pytest -q
+"""
+import hashlib
+import sqlite3
+
+from core.catalog_files import run_catalog_workflow
+
+
+def test_non_utf8_txt_keeps_sha256_when_token_count_fails(tmp_path):
+    root = tmp_path / "library"
+    (root / "Top").mkdir(parents=True)
+    latin1 = "caf\xe9 na\xefve words here".encode("latin-1")
+    (root / "Top" / "latin.txt").write_bytes(latin1)
+    catalog_folder = tmp_path / "catalog"
+    profile_config = {
+        "root_folder_path": str(root),
+        "catalog_folder": str(catalog_folder),
+        "extract_path": "textracted",
+        "excluded_files": [],
+    }
+
+    run_catalog_workflow(profile_config, tokenize=True)
+
+    conn = sqlite3.connect(str(catalog_folder / "library.sqlite"))
+    token_count, sha256 = conn.execute(
+        "SELECT token_count, sha256 FROM catalog WHERE filename = 'latin' AND extension = 'txt'"
+    ).fetchone()
+    conn.close()
+    # Decoding fails, so there is no count, but the record must still be hashed for duplicate detection
+    assert token_count is None
+    assert sha256 == hashlib.sha256(latin1).hexdigest()
+
+
+def test_token_count_failure_logs_decode_error(tmp_path):
+    root = tmp_path / "library"
+    (root / "Top").mkdir(parents=True)
+    (root / "Top" / "latin.txt").write_bytes("caf\xe9".encode("latin-1"))
+    catalog_folder = tmp_path / "catalog"
+    profile_config = {
+        "root_folder_path": str(root),
+        "catalog_folder": str(catalog_folder),
+        "extract_path": "textracted",
+        "excluded_files": [],
+    }
+
+    run_catalog_workflow(profile_config, verbose=True, tokenize=True)
+
+    log_text = (catalog_folder / "logs.txt").read_text(encoding="utf-8")
+    assert "Token counting failed for" in log_text
+    assert "'utf-8' codec can't decode byte 0xe9" in log_text
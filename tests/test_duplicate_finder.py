@@ -0,0 +1,128 @@
+"""
+tests/test_duplicate_finder.py | Duplicate finder regression tests
+Run from the project root: python -m pytest -q
+"""
+import itertools
+import random
+import sqlite3
+from collections import defaultdict
+
+import pandas as pd
+import pytest
+from rapidfuzz import fuzz, distance
+
+import core.duplicate_finder as duplicate_finder
+from adapters.save_to_sqlite import save_dataframe_to_sqlite
+from core.duplicate_finder import compute_similarity, find_duplicates, find_exact_duplicates
+
+
+def _pairwise_similarity(groups):
+    # The original scorer: one token_sort_ratio / Levenshtein call per pair, filtered afterwards
+    rows = []
+    for folder, size_MB, names in groups:
+        for fn1, fn2 in itertools.combinations(names, 2):
+            tsr = fuzz.token_sort_ratio(fn1, fn2)
+            lev_dist = distance.Levenshtein.distance(fn1, fn2)
+            max_len = max(len(fn1), len(fn2)) or 1
+            norm_lev = 1 - (lev_dist / max_len)
+            if tsr >= 90 and norm_lev >= 0.85:
+                confidence = "high"
+            elif tsr >= 80 and norm_lev >= 0.7:
+                confidence = "possible"
+            else:
+                confidence = "unlikely"
+            if tsr >= 80 and norm_lev >= 0.7:
+                rows.append((folder, fn1, fn2, size_MB, tsr, norm_lev, confidence))
+    return rows
+
+
+def _names(count, seed):
+    rng = random.Random(seed)
+    words = ["annual", "report", "draft", "final", "notes", "2020", "2021", "v2", "copy", "scan"]
+    names = []
+    for _ in range(count):
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            name += rng.choice(["", " (1)", "x", "_old"])
+        names.append(name)
+    return names
+
+
+# Length pairs right at the 0.7 normalized Levenshtein boundary (3 of 10, 6 of 20 characters inserted)
+BOUNDARY_NAMES = ["abcdefg", "abcdefgxyz", "abcdefghijklmn", "abcdefghijklmnuvwxyz", "abcdefghijklmnuvwxy", "abcdefgxy"]
+
+
+@pytest.mark.parametrize("block_rows", [duplicate_finder.SIMILARITY_BLOCK_ROWS, 7])
+def test_compute_similarity_matches_pairwise_scoring(monkeypatch, block_rows):
+    monkeypatch.setattr(duplicate_finder, "SIMILARITY_BLOCK_ROWS", block_rows)
+    records = [{'top_level_folder': 'Big', 'filename': fn, 'file_size_MB': '1.0'}
+               for fn in _names(duplicate_finder.SIMILARITY_BLOCK_ROWS + 76, seed=1)]
+    records += [{'top_level_folder': 'Edge', 'filename': fn, 'file_size_MB': '0.5'} for fn in BOUNDARY_NAMES]
+    records += [{'top_level_folder': 'Small', 'filename': fn, 'file_size_MB': str(i % 3)}
+                for i, fn in enumerate(_names(40, seed=2))]
+    groups = find_duplicates(records)
+    assert max(len(names) for _, _, names in groups) > duplicate_finder.SIMILARITY_BLOCK_ROWS
+
+    expected = _pairwise_similarity(groups)
+    actual = list(compute_similarity(groups).itertuples(index=False, name=None))
+    assert any(row[1:3] == ("abcdefg", "abcdefgxyz") and row[5] == 0.7 for row in expected)
+    assert actual == expected
+
+
+def _pairwise_exact(db_path, exclusions):
+    # The original exact-duplicate pass: hash groups in order of their first kept row
+    conn = sqlite3.connect(str(db_path))
+    rows = conn.execute("SELECT relative_path, filename, file_size_in_MB, sha256 FROM catalog").fetchall()
+    conn.close()
+    hash_map = defaultdict(list)
+    for rel_path, filename, file_size_MB, sha256 in rows:
+        top_level = rel_path.split("/")[0]
+        if exclusions and top_level in exclusions:
+            continue
+        if sha256 and sha256.strip():
+            hash_map[sha256].append((top_level, filename, file_size_MB))
+    pairs = []
+    for group in hash_map.values():
+        for i in range(len(group)):
+            for j in range(i + 1, len(group)):
+                pairs.append((group[i][0], group[i][1], group[j][1], group[i][2], 'exact'))
+    return pairs
+
+
+@pytest.mark.parametrize("exclusions", [None, {"Skip"}, {"Skip", "B"}])
+def test_find_exact_duplicates_matches_pairwise_grouping(tmp_path, exclusions):
+    files = [
+        ("Skip", "first copy", "aaa"),
+        ("A", "alpha", "bbb"),
+        ("B", "alpha again", "bbb"),
+        ("A", "second copy", "aaa"),
+        ("A", "third copy", "aaa"),
+        ("Skip", "lonely", "ccc"),
+        ("A", "kept", "ccc"),
+        ("A", "blank one", ""),
+        ("B", "blank two", ""),
+        ("B", "four", "ddd"),
+        ("A", "five", "ddd"),
+        ("B", "six", "ddd"),
+        ("A", "unique", "eee"),
+    ]
+    df = pd.DataFrame({
+        "relative_path": [folder for folder, _, _ in files],
+        "filename": [name for _, name, _ in files],
+        "extension": ["pdf"] * len(files),
+        "last_modified": ["2025-01-01 00:00:00"] * len(files),
+        "file_size_in_MB": [str(i) for i in range(len(files))],
+        "textracted": [False] * len(files),
+        "token_count": [None] * len(files),
+        "sha256": [sha for _, _, sha in files],
+    })
+    catalog_folder = tmp_path / "catalog"
+    assert save_dataframe_to_sqlite(df, tmp_path, catalog_folder)
+    db_path = catalog_folder / "library.sqlite"
+
+    expected = _pairwise_exact(db_path, exclusions)
+    exact_pairs = find_exact_duplicates(str(db_path), exclusions=exclusions)
+    cols = ['top_level_folder', 'filename1', 'filename2', 'file_size_MB', 'confidence']
+    actual = list(zip(*(exact_pairs[c] for c in cols)))
+    assert expected
+    assert actual == expected
@@ -0,0 +1,59 @@
+"""
+tests/test_sqlite_search.py | Filename search regression tests
+Run from the project root: python -m pytest -q
+"""
+import sqlite3
+
+import pandas as pd
+
+from adapters.save_to_sqlite import save_dataframe_to_sqlite
+from core.sqlite_search import search_filenames
+
+
+FILENAMES = [
+    "Résumé 2020",
+    "straße",
+    "日本語のテキスト",
+    "Annual Report",
+    "report draft",
+    "notes",
+    "ab",
+]
+
+
+def _like_filenames(db_path, terms):
+    conn = sqlite3.connect(str(db_path))
+    rows = conn.execute(
+        f"SELECT filename FROM catalog WHERE {' OR '.join('filename LIKE ?' for _ in terms)} "
+        f"ORDER BY relative_path, filename",
+        [f"%{term}%" for term in terms],
+    ).fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+def test_search_matches_like_scan_including_short_non_ascii_terms(tmp_path):
+    df = pd.DataFrame({
+        "relative_path": ["Top"] * len(FILENAMES),
+        "filename": FILENAMES,
+        "extension": ["txt"] * len(FILENAMES),
+        "last_modified": ["2025-01-01 00:00:00"] * len(FILENAMES),
+        "file_size_in_MB": ["0.001"] * len(FILENAMES),
+        "textracted": [False] * len(FILENAMES),
+        "token_count": [None] * len(FILENAMES),
+        "sha256": [None] * len(FILENAMES),
+    })
+    catalog_folder = tmp_path / "catalog"
+    assert save_dataframe_to_sqlite(df, tmp_path, catalog_folder)
+    db_path = catalog_folder / "library.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'catalog_fts'").fetchone() is not None
+    conn.close()
+
+    queries = ["és", "ße", "本", "本語", "日本語", "Résumé", "report", "REPORT", "ab", ["és", "report"], ["本", "notes"]]
+    for query in queries:
+        terms = query if isinstance(query, list) else [query]
+        expected = _like_filenames(db_path, terms)
+        assert expected, query
+        found = [row["filename"] for row in search_filenames(catalog_folder, query)]
+        assert found == expected, query
@@ -10,16 +10,10 @@ Abstract Spec: Provides a dedicated entry point for the YouTube transcript downl
 
 import sys
 import argparse
-from dotenv import load_dotenv
 
-# Import the necessary modules from the existing codebase
-from adapters.yt_transcriber import process_transcript_request
-from core.catalog_files import run_catalog_workflow
+# ports.profile_loader loads .env on first use
 from ports.profile_loader import add_profile_arg, load_profile_config
 
-# Load environment variables
-load_dotenv()
-
 def main():
     """
     Purpose: CLI entry point for YouTube transcript download workflow.
@@ -37,6 +31,10 @@ def main():
     parser.add_argument("--backupdb", action="store_true", help="Backup the SQLite database before making changes")
     args = parser.parse_args()
 
+    # Workflow modules (yt-dlp, pandas, PyMuPDF) are only imported once the arguments are valid
+    from adapters.yt_transcriber import process_transcript_request
+    from core.catalog_files import run_catalog_workflow
+
     try:
         # Load profile-specific config
         profile_config = load_profile_config(args=args)